@@ -8,15 +8,17 @@ Supports two scopes:
 - FULL_SYSTEM: Above + vector metadata, graph entities, configs, rules
 """
 
+import asyncio
 import io
-import json
 import logging
 import os
 import subprocess
 import zipfile
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from datetime import UTC, datetime
+from typing import Any
 
+import orjson
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,6 +26,7 @@ from src.core.admin_ops.domain.backup_job import BackupSchedule, BackupScope
 from src.core.admin_ops.domain.global_rule import GlobalRule
 from src.core.generation.domain.memory_models import ConversationSummary, UserFact
 from src.core.graph.domain.ports.graph_client import GraphClientPort
+from src.core.ingestion.domain.chunk import Chunk
 from src.core.ingestion.domain.document import Document
 from src.core.ingestion.domain.folder import Folder
 from src.core.ingestion.domain.ports.storage import StoragePort
@@ -31,6 +34,36 @@ from src.core.ingestion.domain.ports.vector_store import VectorStoreFactory
 
 logger = logging.getLogger(__name__)
 
+# MIME types whose payload is already compressed; deflating them again only burns CPU
+_COMPRESSED_MIME_PREFIXES = ("image/", "video/", "audio/")
+_COMPRESSED_MIME_TYPES = frozenset(
+    {
+        "application/pdf",
+        "application/zip",
+        "application/gzip",
+        "application/x-7z-compressed",
+        "application/x-rar-compressed",
+        "application/epub+zip",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    }
+)
+
+
+def _is_compressed(mime_type: str | None) -> bool:
+    """Return True if files of this MIME type gain nothing from ZIP deflate."""
+    if not mime_type:
+        return False
+    return mime_type in _COMPRESSED_MIME_TYPES or mime_type.startswith(_COMPRESSED_MIME_PREFIXES)
+
+
+# Sparse vectors come back from Milvus as dict[int, float]; OPT_NON_STR_KEYS
+# writes their keys as strings, as json.dumps did
+_VECTOR_DUMP_OPTIONS = (
+    orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+)
+
 
 class BackupService:
     """
@@ -43,11 +76,22 @@ class BackupService:
         storage: StoragePort,
         graph_client: GraphClientPort,
         vector_store_factory: VectorStoreFactory,
+        session_factory: Callable[[], AsyncSession] | None = None,
     ):
+        """
+        Args:
+            session: Session used for job bookkeeping and sequential reads
+            storage: Object storage holding document files and backups
+            graph_client: Graph client used to export Neo4j data
+            vector_store_factory: Builds a vector store for the tenant collection
+            session_factory: Optional session factory; when given, the table
+                reads of a backup run concurrently, one session per query
+        """
         self.session = session
         self.storage = storage
         self.graph_client = graph_client
         self.vector_store_factory = vector_store_factory
+        self.session_factory = session_factory
 
     async def create_backup(
         self,
@@ -70,6 +114,8 @@ class BackupService:
         """
         logger.info(f"Creating backup for tenant {tenant_id}, scope={scope}, job={job_id}")
 
+        rows = await self._fetch_tenant_rows(tenant_id, scope)
+
         zip_buffer = io.BytesIO()
 
         with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
@@ -85,23 +131,23 @@ class BackupService:
             # ===== USER_DATA scope =====
 
             # 1. Documents metadata
-            await self._add_documents_metadata(zf, tenant_id)
+            self._add_documents_metadata(zf, rows[Document])
             update_progress()
 
             # 2. Folders structure
-            await self._add_folders(zf, tenant_id)
+            self._add_folders(zf, rows[Folder])
             update_progress()
 
             # 3. Original document files
-            await self._add_document_files(zf, tenant_id)
+            self._add_document_files(zf, rows[Document])
             update_progress()
 
             # 4. Conversations
-            await self._add_conversations(zf, tenant_id)
+            self._add_conversations(zf, rows[ConversationSummary])
             update_progress()
 
             # 5. User Facts (memory)
-            await self._add_user_facts(zf, tenant_id)
+            self._add_user_facts(zf, rows[UserFact])
             update_progress()
 
             # 6. Conversation Summaries (memory)
@@ -110,7 +156,7 @@ class BackupService:
 
             # ===== FULL_SYSTEM scope (additional) =====
             # 7. Chunks Table (Critical for re-indexing)
-            await self._add_chunks_table(zf, tenant_id)
+            self._add_chunks_table(zf, rows[Chunk])
             update_progress()
 
             # 8. Vectors (Milvus)
@@ -124,7 +170,7 @@ class BackupService:
             # ===== FULL_SYSTEM scope (additional) =====
             if scope == BackupScope.FULL_SYSTEM:
                 # 10. Global rules
-                await self._add_global_rules(zf, tenant_id)
+                self._add_global_rules(zf, rows[GlobalRule])
                 update_progress()
 
                 # 11. Tenant configuration
@@ -132,7 +178,7 @@ class BackupService:
                 update_progress()
 
                 # 12. Backup Schedules
-                await self._add_backup_schedules(zf, tenant_id)
+                self._add_backup_schedules(zf, rows[BackupSchedule])
                 update_progress()
 
                 # 13. Full Postgres Dump
@@ -147,7 +193,7 @@ class BackupService:
                 "scope": scope.value,
                 "job_id": job_id,
             }
-            zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+            zf.writestr("manifest.json", orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
 
         zip_buffer.seek(0)
         content = zip_buffer.getvalue()
@@ -165,11 +211,39 @@ class BackupService:
         logger.info(f"Uploaded backup to {storage_path}, size: {file_size} bytes")
         return storage_path, file_size
 
-    async def _add_documents_metadata(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
-        """Export documents metadata as JSON."""
-        result = await self.session.execute(select(Document).where(Document.tenant_id == tenant_id))
-        documents = result.scalars().all()
+    async def _fetch_tenant_rows(self, tenant_id: str, scope: BackupScope) -> dict[type, Any]:
+        """
+        Load every tenant-scoped table the archive serializes.
+
+        The SELECTs are independent, so with a session factory they run
+        concurrently (one session each); otherwise they run in turn on the
+        shared session.
+        """
+        models: list[type] = [Document, Folder, ConversationSummary, UserFact, Chunk]
+        if scope == BackupScope.FULL_SYSTEM:
+            models += [GlobalRule, BackupSchedule]
 
+        statements = {model: select(model).where(model.tenant_id == tenant_id) for model in models}
+
+        if self.session_factory is None:
+            rows = {}
+            for model, stmt in statements.items():
+                result = await self.session.execute(stmt)
+                rows[model] = result.scalars().all()
+            return rows
+
+        async def _load(stmt) -> Sequence:
+            async with self.session_factory() as session:
+                result = await session.execute(stmt)
+                return result.scalars().all()
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = {model: tg.create_task(_load(stmt)) for model, stmt in statements.items()}
+
+        return {model: task.result() for model, task in tasks.items()}
+
+    def _add_documents_metadata(self, zf: zipfile.ZipFile, documents: Sequence[Document]) -> None:
+        """Export documents metadata as JSON."""
         data = []
         for doc in documents:
             data.append(
@@ -187,14 +261,11 @@ class BackupService:
                 }
             )
 
-        zf.writestr("documents/metadata.json", json.dumps(data, indent=2))
+        zf.writestr("documents/metadata.json", orjson.dumps(data, option=orjson.OPT_INDENT_2))
         logger.info(f"Added {len(data)} document metadata entries")
 
-    async def _add_folders(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
+    def _add_folders(self, zf: zipfile.ZipFile, folders: Sequence[Folder]) -> None:
         """Export folder structure as JSON."""
-        result = await self.session.execute(select(Folder).where(Folder.tenant_id == tenant_id))
-        folders = result.scalars().all()
-
         data = []
         for folder in folders:
             data.append(
@@ -205,14 +276,11 @@ class BackupService:
                 }
             )
 
-        zf.writestr("folders/folders.json", json.dumps(data, indent=2))
+        zf.writestr("folders/folders.json", orjson.dumps(data, option=orjson.OPT_INDENT_2))
         logger.info(f"Added {len(data)} folders")
 
-    async def _add_document_files(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
+    def _add_document_files(self, zf: zipfile.ZipFile, documents: Sequence[Document]) -> None:
         """Export original document files from storage."""
-        result = await self.session.execute(select(Document).where(Document.tenant_id == tenant_id))
-        documents = result.scalars().all()
-
         for doc in documents:
             if not doc.storage_path:
                 continue
@@ -220,7 +288,16 @@ class BackupService:
                 file_bytes = self.storage.get_file(doc.storage_path)
                 # Preserve folder structure: documents/files/{folder_id or root}/{filename}
                 folder_path = doc.folder_id if doc.folder_id else "root"
-                zf.writestr(f"documents/files/{folder_path}/{doc.filename}", file_bytes)
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if _is_compressed(doc.metadata_.get("mime_type"))
+                    else zipfile.ZIP_DEFLATED
+                )
+                zf.writestr(
+                    f"documents/files/{folder_path}/{doc.filename}",
+                    file_bytes,
+                    compress_type=compress_type,
+                )
             except Exception as e:
                 logger.warning(f"Could not retrieve file for document {doc.id}: {e}")
                 zf.writestr(
@@ -228,13 +305,10 @@ class BackupService:
                     f"File not found: {doc.storage_path}\nError: {str(e)}",
                 )
 
-    async def _add_conversations(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
+    def _add_conversations(
+        self, zf: zipfile.ZipFile, conversations: Sequence[ConversationSummary]
+    ) -> None:
         """Export conversation summaries as JSON."""
-        result = await self.session.execute(
-            select(ConversationSummary).where(ConversationSummary.tenant_id == tenant_id)
-        )
-        conversations = result.scalars().all()
-
         data = []
         for conv in conversations:
             data.append(
@@ -248,14 +322,13 @@ class BackupService:
                 }
             )
 
-        zf.writestr("conversations/conversations.json", json.dumps(data, indent=2))
+        zf.writestr(
+            "conversations/conversations.json", orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        )
         logger.info(f"Added {len(data)} conversations")
 
-    async def _add_user_facts(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
+    def _add_user_facts(self, zf: zipfile.ZipFile, facts: Sequence[UserFact]) -> None:
         """Export user facts (memory) as JSON."""
-        result = await self.session.execute(select(UserFact).where(UserFact.tenant_id == tenant_id))
-        facts = result.scalars().all()
-
         data = []
         for fact in facts:
             data.append(
@@ -269,7 +342,7 @@ class BackupService:
                 }
             )
 
-        zf.writestr("memory/user_facts.json", json.dumps(data, indent=2))
+        zf.writestr("memory/user_facts.json", orjson.dumps(data, option=orjson.OPT_INDENT_2))
         logger.info(f"Added {len(data)} user facts")
 
     async def _add_conversation_summaries(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
@@ -278,13 +351,8 @@ class BackupService:
         # For now, we reuse the conversation export
         pass  # Already covered in _add_conversations
 
-    async def _add_global_rules(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
+    def _add_global_rules(self, zf: zipfile.ZipFile, rules: Sequence[GlobalRule]) -> None:
         """Export global rules as JSON."""
-        result = await self.session.execute(
-            select(GlobalRule).where(GlobalRule.tenant_id == tenant_id)
-        )
-        rules = result.scalars().all()
-
         data = []
         for rule in rules:
             data.append(
@@ -299,7 +367,7 @@ class BackupService:
                 }
             )
 
-        zf.writestr("config/global_rules.json", json.dumps(data, indent=2))
+        zf.writestr("config/global_rules.json", orjson.dumps(data, option=orjson.OPT_INDENT_2))
         logger.info(f"Added {len(data)} global rules")
 
     async def _add_tenant_config(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
@@ -316,13 +384,11 @@ class BackupService:
                 "config": tenant.config or {},
                 "is_active": tenant.is_active,
             }
-            zf.writestr("config/tenant_config.json", json.dumps(data, indent=2))
+            zf.writestr("config/tenant_config.json", orjson.dumps(data, option=orjson.OPT_INDENT_2))
             logger.info("Added tenant configuration")
 
     async def _add_vector_metadata(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
         """Export vector store metadata (counts, not actual vectors)."""
-        from src.core.ingestion.domain.chunk import Chunk
-
         try:
             result = await self.session.execute(
                 select(func.count(Chunk.id)).where(Chunk.tenant_id == tenant_id)
@@ -334,11 +400,13 @@ class BackupService:
                 "chunk_count": chunk_count,
                 "note": "Vectors cannot be exported directly. Re-indexing will be required after restore.",
             }
-            zf.writestr("vectors/metadata.json", json.dumps(data, indent=2))
+            zf.writestr("vectors/metadata.json", orjson.dumps(data, option=orjson.OPT_INDENT_2))
             logger.info(f"Added vector metadata: {chunk_count} chunks")
         except Exception as e:
             logger.warning(f"Could not export vector metadata: {e}")
-            zf.writestr("vectors/metadata.json", json.dumps({"error": str(e)}, indent=2))
+            zf.writestr(
+                "vectors/metadata.json", orjson.dumps({"error": str(e)}, option=orjson.OPT_INDENT_2)
+            )
 
     async def _add_graph_metadata(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
         """Export graph database metadata (structure info, not full data)."""
@@ -348,16 +416,13 @@ class BackupService:
             "tenant_id": tenant_id,
             "note": "Graph database entities are not included in application backup. Use scripts/backup.sh for full Neo4j backup.",
         }
-        zf.writestr("graph/metadata.json", json.dumps(data, indent=2))
+        zf.writestr("graph/metadata.json", orjson.dumps(data, option=orjson.OPT_INDENT_2))
         logger.info("Added graph metadata note")
 
-    async def _add_backup_schedules(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
+    def _add_backup_schedules(
+        self, zf: zipfile.ZipFile, schedules: Sequence[BackupSchedule]
+    ) -> None:
         """Export backup schedules as JSON."""
-        result = await self.session.execute(
-            select(BackupSchedule).where(BackupSchedule.tenant_id == tenant_id)
-        )
-        schedules = result.scalars().all()
-
         data = []
         for schedule in schedules:
             data.append(
@@ -373,7 +438,7 @@ class BackupService:
                 }
             )
 
-        zf.writestr("config/backup_schedules.json", json.dumps(data, indent=2))
+        zf.writestr("config/backup_schedules.json", orjson.dumps(data, option=orjson.OPT_INDENT_2))
         logger.info(f"Added {len(data)} backup schedules")
 
     async def list_backups(self, tenant_id: str) -> list[dict]:
@@ -424,13 +489,8 @@ class BackupService:
 
         return True
 
-    async def _add_chunks_table(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
+    def _add_chunks_table(self, zf: zipfile.ZipFile, chunks: Sequence[Chunk]) -> None:
         """Export chunks table as JSON."""
-        from src.core.ingestion.domain.chunk import Chunk
-
-        result = await self.session.execute(select(Chunk).where(Chunk.tenant_id == tenant_id))
-        chunks = result.scalars().all()
-
         data = []
         for chunk in chunks:
             data.append(
@@ -447,7 +507,7 @@ class BackupService:
                 }
             )
 
-        zf.writestr("ingestion/chunks.json", json.dumps(data, indent=2))
+        zf.writestr("ingestion/chunks.json", orjson.dumps(data, option=orjson.OPT_INDENT_2))
         logger.info(f"Added {len(data)} chunks to backup")
 
     async def _add_vectors(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
@@ -474,9 +534,9 @@ class BackupService:
         tmp_path = f"/tmp/vectors_{tenant_id}_{datetime.now(UTC).timestamp()}.jsonl"
         try:
             count = 0
-            with open(tmp_path, "w") as f:
+            with open(tmp_path, "wb") as f:
                 async for vec in vector_store.export_vectors(tenant_id):
-                    f.write(json.dumps(vec) + "\n")
+                    f.write(orjson.dumps(vec, option=_VECTOR_DUMP_OPTIONS))
                     count += 1
 
             if count > 0:
@@ -497,9 +557,9 @@ class BackupService:
         tmp_path = f"/tmp/graph_{tenant_id}_{datetime.now(UTC).timestamp()}.jsonl"
         try:
             count = 0
-            with open(tmp_path, "w") as f:
+            with open(tmp_path, "wb") as f:
                 async for item in self.graph_client.export_graph(tenant_id):
-                    f.write(json.dumps(item) + "\n")
+                    f.write(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE))
                     count += 1
 
             if count > 0:
@@ -9,7 +9,6 @@ Supports two modes:
 """
 
 import io
-import json
 import logging
 import os
 import subprocess
@@ -17,6 +16,7 @@ import zipfile
 from collections.abc import Callable
 from datetime import datetime
 
+import orjson
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -105,7 +105,7 @@ class RestoreService:
                 if "manifest.json" not in zf.namelist():
                     raise ValueError("Invalid backup: manifest.json not found")
 
-                manifest_data = json.loads(zf.read("manifest.json"))
+                manifest_data = orjson.loads(zf.read("manifest.json"))
                 manifest = BackupManifest(manifest_data)
 
                 if not manifest.is_valid:
@@ -148,10 +148,11 @@ class RestoreService:
             zip_buffer = io.BytesIO(file_bytes)
 
             with zipfile.ZipFile(zip_buffer, "r") as zf:
+                # Index the central directory once; namelist() rebuilds a list per call
+                entries = {info.filename: info for info in zf.infolist()}
+
                 # Determine restore strategy
-                has_dump = (
-                    "database/postgres_dump.sql" in zf.namelist() and mode == RestoreMode.REPLACE
-                )
+                has_dump = "database/postgres_dump.sql" in entries and mode == RestoreMode.REPLACE
 
                 # Estimated total steps
                 # If Dump: Dump(1) + Files(1) + Vectors(1) + Graph(1) = 4
@@ -177,37 +178,37 @@ class RestoreService:
 
                     # 1. Folders
                     result.folders_restored = await self._restore_folders(
-                        zf, target_tenant_id, mode
+                        zf, entries, target_tenant_id, mode
                     )
                     update_progress()
 
                     # 2. Documents
                     result.documents_restored = await self._restore_documents(
-                        zf, target_tenant_id, mode
+                        zf, entries, target_tenant_id, mode
                     )
                     update_progress()
 
                     # 3. Conversations
                     result.conversations_restored = await self._restore_conversations(
-                        zf, target_tenant_id, mode
+                        zf, entries, target_tenant_id, mode
                     )
                     update_progress()
 
                     # 4. User Facts
                     result.facts_restored = await self._restore_user_facts(
-                        zf, target_tenant_id, mode
+                        zf, entries, target_tenant_id, mode
                     )
                     update_progress()
 
                     # 5. Configs & Schedules
-                    if "config/global_rules.json" in zf.namelist():
+                    if "config/global_rules.json" in entries:
                         if mode == RestoreMode.REPLACE:
                             await self.session.execute(
                                 delete(GlobalRule).where(GlobalRule.tenant_id == target_tenant_id)
                             )
                         await self._restore_global_rules(zf, target_tenant_id, mode)
 
-                    if "config/backup_schedules.json" in zf.namelist():
+                    if "config/backup_schedules.json" in entries:
                         if mode == RestoreMode.REPLACE:
                             await self.session.execute(
                                 delete(BackupSchedule).where(
@@ -216,26 +217,26 @@ class RestoreService:
                             )
                         await self._restore_backup_schedules(zf, target_tenant_id, mode)
 
-                    if "config/tenant_config.json" in zf.namelist():
+                    if "config/tenant_config.json" in entries:
                         await self._restore_tenant_config(zf, target_tenant_id)
                     update_progress()
 
                     # 6. Chunks
-                    await self._restore_chunks(zf, target_tenant_id, mode)
+                    await self._restore_chunks(zf, entries, target_tenant_id, mode)
                     update_progress()
 
                 # Shared Steps (External Systems & Files)
 
                 # Restore Files (MinIO)
-                await self._restore_document_files(zf, target_tenant_id)
+                await self._restore_document_files(zf, entries, target_tenant_id)
                 update_progress()
 
                 # Restore Vectors (Milvus)
-                await self._restore_vectors(zf, target_tenant_id, mode)
+                await self._restore_vectors(zf, entries, target_tenant_id, mode)
                 update_progress()
 
                 # Restore Graph (Neo4j)
-                await self._restore_graph(zf, target_tenant_id, mode)
+                await self._restore_graph(zf, entries, target_tenant_id, mode)
                 update_progress()
 
                 await self.session.commit()
@@ -259,14 +260,20 @@ class RestoreService:
         await self.session.execute(delete(Folder).where(Folder.tenant_id == tenant_id))
         await self.session.flush()
 
-    async def _restore_folders(self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode) -> int:
+    async def _restore_folders(
+        self,
+        zf: zipfile.ZipFile,
+        entries: dict[str, zipfile.ZipInfo],
+        tenant_id: str,
+        mode: RestoreMode,
+    ) -> int:
         """Restore folders from backup."""
         count = 0
 
-        if "folders/folders.json" not in zf.namelist():
+        if "folders/folders.json" not in entries:
             return 0
 
-        data = json.loads(zf.read("folders/folders.json"))
+        data = orjson.loads(zf.read("folders/folders.json"))
 
         for folder_data in data:
             folder_id = folder_data.get("id")
@@ -290,15 +297,19 @@ class RestoreService:
         return count
 
     async def _restore_documents(
-        self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode
+        self,
+        zf: zipfile.ZipFile,
+        entries: dict[str, zipfile.ZipInfo],
+        tenant_id: str,
+        mode: RestoreMode,
     ) -> int:
         """Restore document metadata from backup."""
         count = 0
 
-        if "documents/metadata.json" not in zf.namelist():
+        if "documents/metadata.json" not in entries:
             return 0
 
-        data = json.loads(zf.read("documents/metadata.json"))
+        data = orjson.loads(zf.read("documents/metadata.json"))
 
         for doc_data in data:
             doc_id = doc_data.get("id")
@@ -330,17 +341,23 @@ class RestoreService:
 
         return count
 
-    async def _restore_document_files(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
-        """Restore document files to storage."""
+    async def _restore_document_files(
+        self,
+        zf: zipfile.ZipFile,
+        entries: dict[str, zipfile.ZipInfo],
+        tenant_id: str,
+    ) -> None:
+        """Restore document files to storage, streaming each entry out of the archive."""
         try:
             # Find all files in documents/files/
             file_entries = [
-                name
-                for name in zf.namelist()
-                if name.startswith("documents/files/") and not name.endswith("/")
+                info
+                for name, info in entries.items()
+                if name.startswith("documents/files/") and not info.is_dir()
             ]
 
-            for file_path in file_entries:
+            for info in file_entries:
+                file_path = info.filename
                 try:
                     # Extract folder_id and filename from path
                     parts = file_path.replace("documents/files/", "").split("/", 1)
@@ -361,15 +378,15 @@ class RestoreService:
                     doc = result.scalar_one_or_none()
 
                     if doc and doc.storage_path:
-                        # Upload file to storage
-                        file_bytes = zf.read(file_path)
-                        self.storage.upload_file(
-                            object_name=doc.storage_path,
-                            data=io.BytesIO(file_bytes),
-                            length=len(file_bytes),
-                            content_type=doc.metadata_.get("mime_type")
-                            or "application/octet-stream",
-                        )
+                        # Stream the entry into storage instead of materializing it
+                        with zf.open(info) as file_stream:
+                            self.storage.upload_file(
+                                object_name=doc.storage_path,
+                                data=file_stream,
+                                length=info.file_size,
+                                content_type=doc.metadata_.get("mime_type")
+                                or "application/octet-stream",
+                            )
 
                 except Exception as e:
                     logger.warning(f"Error restoring file {file_path}: {e}")
@@ -378,15 +395,19 @@ class RestoreService:
             logger.warning(f"Error restoring document files: {e}")
 
     async def _restore_conversations(
-        self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode
+        self,
+        zf: zipfile.ZipFile,
+        entries: dict[str, zipfile.ZipInfo],
+        tenant_id: str,
+        mode: RestoreMode,
     ) -> int:
         """Restore conversations from backup."""
         count = 0
 
-        if "conversations/conversations.json" not in zf.namelist():
+        if "conversations/conversations.json" not in entries:
             return 0
 
-        data = json.loads(zf.read("conversations/conversations.json"))
+        data = orjson.loads(zf.read("conversations/conversations.json"))
 
         for conv_data in data:
             conv_id = conv_data.get("id")
@@ -415,15 +436,19 @@ class RestoreService:
         return count
 
     async def _restore_user_facts(
-        self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode
+        self,
+        zf: zipfile.ZipFile,
+        entries: dict[str, zipfile.ZipInfo],
+        tenant_id: str,
+        mode: RestoreMode,
     ) -> int:
         """Restore user facts from backup."""
         count = 0
 
-        if "memory/user_facts.json" not in zf.namelist():
+        if "memory/user_facts.json" not in entries:
             return 0
 
-        data = json.loads(zf.read("memory/user_facts.json"))
+        data = orjson.loads(zf.read("memory/user_facts.json"))
 
         for fact_data in data:
             fact_id = fact_data.get("id")
@@ -456,7 +481,7 @@ class RestoreService:
     ) -> int:
         """Restore global rules."""
         count = 0
-        data = json.loads(zf.read("config/global_rules.json"))
+        data = orjson.loads(zf.read("config/global_rules.json"))
         for rule_data in data:
             rule_id = rule_data.get("id")
 
@@ -486,7 +511,7 @@ class RestoreService:
     ) -> int:
         """Restore backup schedules."""
         count = 0
-        data = json.loads(zf.read("config/backup_schedules.json"))
+        data = orjson.loads(zf.read("config/backup_schedules.json"))
         for schedule_data in data:
             schedule_id = schedule_data.get("id")
 
@@ -516,7 +541,7 @@ class RestoreService:
 
     async def _restore_tenant_config(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
         """Restore tenant configuration."""
-        data = json.loads(zf.read("config/tenant_config.json"))
+        data = orjson.loads(zf.read("config/tenant_config.json"))
         config = data.get("config", {})
 
         # Update existing tenant
@@ -535,12 +560,18 @@ class RestoreService:
             await self.session.flush()
             logger.info(f"Restored configuration for tenant {tenant_id}")
 
-    async def _restore_chunks(self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode) -> None:
+    async def _restore_chunks(
+        self,
+        zf: zipfile.ZipFile,
+        entries: dict[str, zipfile.ZipInfo],
+        tenant_id: str,
+        mode: RestoreMode,
+    ) -> None:
         """Restore chunks table."""
-        if "ingestion/chunks.json" not in zf.namelist():
+        if "ingestion/chunks.json" not in entries:
             return
 
-        data = json.loads(zf.read("ingestion/chunks.json"))
+        data = orjson.loads(zf.read("ingestion/chunks.json"))
 
         for chunk_data in data:
             chunk_id = chunk_data.get("id")
@@ -566,7 +597,11 @@ class RestoreService:
         logger.info(f"Restored {len(data)} chunks")
 
     async def _restore_vectors(
-        self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode
+        self,
+        zf: zipfile.ZipFile,
+        entries: dict[str, zipfile.ZipInfo],
+        tenant_id: str,
+        mode: RestoreMode,
     ) -> None:
         """Restore vectors to Milvus."""
         from src.core.tenants.application.active_vector_collection import (
@@ -574,7 +609,7 @@ class RestoreService:
         )
         from src.core.tenants.domain.tenant import Tenant
 
-        if "vectors/vectors.jsonl" not in zf.namelist():
+        if "vectors/vectors.jsonl" not in entries:
             return
 
         # Resolve collection
@@ -596,17 +631,23 @@ class RestoreService:
                 def vector_gen():
                     for line in f:
                         if line.strip():
-                            yield json.loads(line)
+                            yield orjson.loads(line)
 
                 count = await vector_store.import_vectors(vector_gen())
                 logger.info(f"Restored {count} vectors")
         finally:
             await vector_store.close()
 
-    async def _restore_graph(self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode) -> None:
+    async def _restore_graph(
+        self,
+        zf: zipfile.ZipFile,
+        entries: dict[str, zipfile.ZipInfo],
+        tenant_id: str,
+        mode: RestoreMode,
+    ) -> None:
         """Restore graph to Neo4j."""
 
-        if "graph/graph.jsonl" not in zf.namelist():
+        if "graph/graph.jsonl" not in entries:
             return
 
         with zf.open("graph/graph.jsonl") as f:
@@ -614,7 +655,7 @@ class RestoreService:
             def graph_gen():
                 for line in f:
                     if line.strip():
-                        yield json.loads(line)
+                        yield orjson.loads(line)
 
             stats = await self.graph_client.import_graph(graph_gen(), mode=mode.value.lower())
             logger.info(f"Restored graph: {stats}")
@@ -11,6 +11,7 @@ from src.core.graph.application.writer import graph_writer
 from src.core.graph.domain.ports.graph_extractor import GraphExtractorPort, get_graph_extractor
 
 if TYPE_CHECKING:
+    from src.core.generation.application.prompts.entity_extraction import ExtractionResult
     from src.core.ingestion.domain.chunk import Chunk
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,9 @@ class GraphProcessor:
     Takes chunks, runs extraction, and writes to Neo4j.
     """
 
+    # Chunks per graph write: bounds the size of each Neo4j transaction
+    WRITE_BATCH_SIZE = 32
+
     def __init__(self, graph_extractor: GraphExtractorPort | None = None):
         self.extractor = graph_extractor
         self.writer = graph_writer
@@ -36,6 +40,14 @@ class GraphProcessor:
     ):
         """
         Process a list of chunks to extract and write graph data.
+
+        Extraction runs concurrently per chunk. Results are queued per
+        document and written every WRITE_BATCH_SIZE chunks, with the
+        remainder written once extraction finishes. A failed write is
+        all-or-nothing for its batch: every chunk in it counts as a chunk error.
+
+        progress_callback receives (completed, total). The final
+        (total, total) call is made only after the graph writes finish.
         """
         if not chunks:
             return
@@ -93,6 +105,35 @@ class GraphProcessor:
 
         total_chunks = len(chunks)
         chunks_completed = 0
+        # Results are queued per document and written in bounded batches
+        pending_writes: dict[str, list[tuple[str, ExtractionResult]]] = {}
+        write_seconds = 0.0
+
+        def _report_progress(completed: int) -> None:
+            if progress_callback:
+                try:
+                    progress_callback(completed, total_chunks)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
+
+        async def _write_batch(document_id: str, items: list[tuple[str, "ExtractionResult"]]):
+            nonlocal chunk_errors
+            nonlocal write_seconds
+            write_started = time.perf_counter()
+            try:
+                await self.writer.write_extraction_results_bulk(
+                    document_id=document_id,
+                    tenant_id=tenant_id,
+                    items=items,
+                    filename=filename,
+                )
+            except Exception as e:
+                chunk_errors += len(items)
+                logger.error(
+                    f"Graph write failed for {len(items)} chunks of document {document_id}: {e}"
+                )
+            finally:
+                write_seconds += time.perf_counter() - write_started
 
         async def _process_one(chunk, chunk_number: int):
             nonlocal total_tokens
@@ -106,6 +147,7 @@ class GraphProcessor:
             nonlocal chunk_errors
             nonlocal chunks_completed
             chunk_started = time.perf_counter()
+            full_batch = None
             chunk_metrics: dict[str, Any] = {
                 "event": "graph_sync_chunk_metrics",
                 "document_id": chunk.document_id,
@@ -117,7 +159,6 @@ class GraphProcessor:
                 "concurrency_mode": concurrency_mode,
                 "extract_wait_ms": 0,
                 "extract_ms": 0,
-                "write_ms": 0,
                 "llm_calls": 0,
                 "tokens_total": 0,
                 "entities": 0,
@@ -191,17 +232,11 @@ class GraphProcessor:
                 if chunk_metrics["cache_hit"]:
                     cache_hits += 1
 
-                # Keep writes out of the LLM semaphore so the next extraction can start immediately.
                 if result.entities:
-                    write_started = time.perf_counter()
-                    await self.writer.write_extraction_result(
-                        document_id=chunk.document_id,
-                        chunk_id=chunk.id,
-                        tenant_id=tenant_id,
-                        result=result,
-                        filename=filename,
-                    )
-                    chunk_metrics["write_ms"] = int((time.perf_counter() - write_started) * 1000)
+                    batch = pending_writes.setdefault(chunk.document_id, [])
+                    batch.append((chunk.id, result))
+                    if len(batch) >= self.WRITE_BATCH_SIZE:
+                        full_batch = pending_writes.pop(chunk.document_id)
 
             except Exception as e:
                 chunk_errors += 1
@@ -212,15 +247,22 @@ class GraphProcessor:
                 logger.info("graph_sync_chunk_metrics %s", json.dumps(chunk_metrics, sort_keys=True))
 
                 chunks_completed += 1
-                if progress_callback:
-                    try:
-                        progress_callback(chunks_completed, total_chunks)
-                    except Exception as e:
-                        logger.warning(f"Progress callback failed: {e}")
+                # The last step is reserved for the graph writes below
+                if chunks_completed < total_chunks:
+                    _report_progress(chunks_completed)
+
+            # Written outside the extraction slot, so the write does not hold it
+            if full_batch:
+                await _write_batch(chunk.document_id, full_batch)
 
         tasks = [_process_one(c, idx) for idx, c in enumerate(chunks, start=1)]
         await asyncio.gather(*tasks)
 
+        for document_id, items in pending_writes.items():
+            await _write_batch(document_id, items)
+        write_ms = int(write_seconds * 1000)
+        _report_progress(total_chunks)
+
         total_ms = int((time.perf_counter() - document_started) * 1000)
         throughput = 0.0
         if total_ms > 0:
@@ -242,6 +284,7 @@ class GraphProcessor:
                     "final_concurrency_limit": final_limit,
                     "total_chunks": len(chunks),
                     "total_ms": total_ms,
+                    "write_ms": write_ms,
                     "chunks_per_minute": round(throughput, 3),
                     "llm_calls_total": total_llm_calls,
                     "tokens_total": total_tokens,
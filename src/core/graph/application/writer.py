@@ -20,6 +20,38 @@ class GraphWriter:
         safe_type = re.sub(r"[^A-Z0-9_]", "_", raw_type.upper())
         return safe_type or "RELATED_TO"
 
+    # Cypher fragments shared by the single-chunk and bulk base queries
+    _DOCUMENT_MERGE = f"""
+        MERGE (d:{NodeLabel.Document.value} {{id: $document_id}})
+        ON CREATE SET d.tenant_id = $tenant_id, d.filename = $filename
+        ON MATCH SET d.filename = CASE WHEN d.filename IS NULL THEN $filename ELSE d.filename END
+        """
+
+    @staticmethod
+    def _chunk_merge(chunk_id: str) -> str:
+        return f"""
+        MERGE (c:{NodeLabel.Chunk.value} {{id: {chunk_id}}})
+        ON CREATE SET c.document_id = $document_id, c.tenant_id = $tenant_id
+
+        MERGE (d)-[:{RelationshipType.HAS_CHUNK.value}]->(c)
+        """
+
+    @staticmethod
+    def _mentions_merge(entities: str) -> str:
+        return f"""
+        UNWIND {entities} as ent
+        MERGE (e:{NodeLabel.Entity.value} {{name: ent.name, tenant_id: $tenant_id}})
+        ON CREATE SET
+            e.type = ent.type,
+            e.description = ent.description,
+            e.created_at = timestamp()
+        MERGE (c)-[:{RelationshipType.MENTIONS.value}]->(e)
+        """
+
+    @staticmethod
+    def _context_params(document_id: str, tenant_id: str, filename: str | None) -> dict[str, Any]:
+        return {"document_id": document_id, "tenant_id": tenant_id, "filename": filename}
+
     def _build_base_query_and_params(
         self,
         *,
@@ -29,37 +61,33 @@ class GraphWriter:
         filename: str | None,
         entities_param: list[dict[str, Any]],
     ) -> tuple[str, dict[str, Any]]:
-        query = f"""
-        // 1. Ensure Context (Document & Chunk)
-        MERGE (d:{NodeLabel.Document.value} {{id: $document_id}})
-        ON CREATE SET d.tenant_id = $tenant_id, d.filename = $filename
-        ON MATCH SET d.filename = CASE WHEN d.filename IS NULL THEN $filename ELSE d.filename END
-
-        MERGE (c:{NodeLabel.Chunk.value} {{id: $chunk_id}})
-        ON CREATE SET c.document_id = $document_id, c.tenant_id = $tenant_id
+        # 1. Ensure Context (Document & Chunk)
+        query = self._DOCUMENT_MERGE + self._chunk_merge("$chunk_id")
+        if entities_param:
+            query += "WITH c" + self._mentions_merge("$entities")
 
-        MERGE (d)-[:{RelationshipType.HAS_CHUNK.value}]->(c)
-        """
+        params = self._context_params(document_id, tenant_id, filename)
+        params.update(chunk_id=chunk_id, entities=entities_param)
+        return query, params
 
-        if entities_param:
-            query += f"""
-            WITH c
-            UNWIND $entities as ent
-            MERGE (e:{NodeLabel.Entity.value} {{name: ent.name, tenant_id: $tenant_id}})
-            ON CREATE SET
-                e.type = ent.type,
-                e.description = ent.description,
-                e.created_at = timestamp()
-            MERGE (c)-[:{RelationshipType.MENTIONS.value}]->(e)
-            """
+    def _build_bulk_base_query_and_params(
+        self,
+        *,
+        document_id: str,
+        tenant_id: str,
+        filename: str | None,
+        chunks_param: list[dict[str, Any]],
+    ) -> tuple[str, dict[str, Any]]:
+        query = (
+            self._DOCUMENT_MERGE
+            + "WITH d UNWIND $chunks as chunk"
+            + self._chunk_merge("chunk.chunk_id")
+            + "WITH c, chunk"
+            + self._mentions_merge("chunk.entities")
+        )
 
-        params = {
-            "document_id": document_id,
-            "chunk_id": chunk_id,
-            "tenant_id": tenant_id,
-            "filename": filename,
-            "entities": entities_param,
-        }
+        params = self._context_params(document_id, tenant_id, filename)
+        params["chunks"] = chunks_param
         return query, params
 
     def _build_relationship_queries(
@@ -128,40 +156,105 @@ class GraphWriter:
             relationships=result.relationships,
             tenant_id=tenant_id,
         )
+        await self._write_statements(
+            statements=[(base_query, base_params), *relationship_queries],
+            tenant_id=tenant_id,
+            entity_names=[e["name"] for e in entities_param],
+            target=f"chunk {chunk_id}",
+        )
+
+        logger.info(
+            f"Graph write complete for chunk {chunk_id}: "
+            f"{len(entities_param)} entities, {len(result.relationships)} relationships"
+        )
+
+    async def write_extraction_results_bulk(
+        self,
+        document_id: str,
+        tenant_id: str,
+        items: list[tuple[str, ExtractionResult]],
+        filename: str = None,
+    ):
+        """
+        Persist extraction results for several chunks of one document at once.
+
+        Chunks and mentions go through a single UNWIND query and relationships
+        are grouped by type across all chunks, so the items are one batch
+        instead of one write per chunk. Callers bound the batch size.
+
+        Args:
+            document_id: ID of the parent document
+            tenant_id: Tenant context
+            items: (chunk_id, extraction result) pairs
+            filename: Original filename of the document
+        """
+        items = [(chunk_id, r) for chunk_id, r in items if r.entities or r.relationships]
+        if not items:
+            logger.info(f"No graph data to write for document {document_id}")
+            return
+
+        chunks_param = [
+            {"chunk_id": chunk_id, "entities": [e.model_dump() for e in r.entities]}
+            for chunk_id, r in items
+        ]
+        base_query, base_params = self._build_bulk_base_query_and_params(
+            document_id=document_id,
+            tenant_id=tenant_id,
+            filename=filename,
+            chunks_param=chunks_param,
+        )
+        relationships = [rel for _, r in items for rel in r.relationships]
+        relationship_queries = self._build_relationship_queries(
+            relationships=relationships,
+            tenant_id=tenant_id,
+        )
+        entity_names = list(
+            dict.fromkeys(ent["name"] for chunk in chunks_param for ent in chunk["entities"])
+        )
+
+        await self._write_statements(
+            statements=[(base_query, base_params), *relationship_queries],
+            tenant_id=tenant_id,
+            entity_names=entity_names,
+            target=f"document {document_id}",
+        )
+
+        logger.info(
+            f"Graph write complete for document {document_id}: {len(items)} chunks, "
+            f"{len(entity_names)} entities, {len(relationships)} relationships"
+        )
+
+    async def _write_statements(
+        self,
+        *,
+        statements: list[tuple[str, dict[str, Any] | None]],
+        tenant_id: str,
+        entity_names: list[str],
+        target: str,
+    ) -> None:
+        """Run the write statements, then mark the touched communities stale."""
         graph_client = get_graph_client()
 
         try:
-            statements: list[tuple[str, dict[str, Any] | None]] = [(base_query, base_params)]
-            statements.extend(relationship_queries)
-
-            if relationship_queries and hasattr(graph_client, "execute_write_batch"):
+            if len(statements) > 1 and hasattr(graph_client, "execute_write_batch"):
                 await graph_client.execute_write_batch(statements)
             else:
-                await graph_client.execute_write(base_query, base_params)
-                for rel_query, rel_params in relationship_queries:
-                    await graph_client.execute_write(rel_query, rel_params)
+                for query, params in statements:
+                    await graph_client.execute_write(query, params)
+        except Exception as e:
+            logger.error(f"Failed to write graph data for {target}: {e}")
+            raise
 
-            logger.info(
-                f"Graph write complete for chunk {chunk_id}: "
-                f"{len(entities_param)} entities, {len(result.relationships)} relationships"
+        # Trigger community staleness (Phase 4.3)
+        try:
+            from src.core.graph.application.communities.lifecycle import (
+                CommunityLifecycleManager,
             )
 
-            # Trigger community staleness (Phase 4.3)
-            try:
-                from src.core.graph.application.communities.lifecycle import (
-                    CommunityLifecycleManager,
-                )
-
-                lifecycle = CommunityLifecycleManager(graph_client)
-                await lifecycle.mark_stale_by_entities_by_name(
-                    [e["name"] for e in entities_param], tenant_id
-                )
-            except Exception as e:
-                logger.warning(f"Failed to trigger community staleness: {e}")
-
+            lifecycle = CommunityLifecycleManager(graph_client)
+            await lifecycle.mark_stale_by_entities_by_name(entity_names, tenant_id)
         except Exception as e:
-            logger.error(f"Failed to write graph data for chunk {chunk_id}: {e}")
-            raise
+            logger.warning(f"Failed to trigger community staleness: {e}")
 
 
 graph_writer = GraphWriter()
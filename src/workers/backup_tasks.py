@@ -140,7 +140,11 @@ async def _create_backup_async(job_id: str, tenant_id: str, scope: str, task_id:
             from src.amber_platform.composition_root import build_vector_store_factory, platform
 
             backup_service = BackupService(
-                session, storage, platform.neo4j_client, build_vector_store_factory()
+                session,
+                storage,
+                platform.neo4j_client,
+                build_vector_store_factory(),
+                session_factory=async_session,
             )
 
             def progress_callback(progress: int):
@@ -597,6 +597,14 @@ async def _mark_document_failed(document_id: str, error: str):
         await engine.dispose()
 
 
+def _build_status_payload(document_id: str, status: str, progress: int, error: str = None) -> dict:
+    """Build the document status message published to Redis."""
+    message = {"document_id": document_id, "status": status, "progress": progress}
+    if error:
+        message["error"] = error
+    return message
+
+
 def _publish_status(document_id: str, status: str, progress: int, error: str = None):
     """Publish status update to Redis Pub/Sub."""
     import json
@@ -609,9 +617,7 @@ def _publish_status(document_id: str, status: str, progress: int, error: str = N
         r = redis.Redis.from_url(settings.db.redis_url)
         try:
             channel = f"document:{document_id}:status"
-            message = {"document_id": document_id, "status": status, "progress": progress}
-            if error:
-                message["error"] = error
+            message = _build_status_payload(document_id, status, progress, error)
 
             r.publish(channel, json.dumps(message))
         finally:
@@ -125,6 +125,17 @@ async def db_session() -> AsyncSession:
             await session.close()
 
 
+# ============================================================================
+# API Schema Fixtures
+# ============================================================================
+@pytest.fixture(scope="session")
+def openapi_dict() -> dict:
+    """OpenAPI schema of the API app, generated once per test session."""
+    from src.api.main import app
+
+    return app.openapi()
+
+
 @pytest.fixture(autouse=True)
 def cleanup_application_state():
     """
@@ -2,21 +2,26 @@ import io
 import json
 import zipfile
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
 
-from src.core.admin_ops.application.backup_service import BackupService
+from src.core.admin_ops.application.backup_service import BackupService, _is_compressed
 from src.core.admin_ops.application.restore_service import RestoreService
 from src.core.admin_ops.domain.backup_job import BackupSchedule, BackupScope, RestoreMode
 from src.core.admin_ops.domain.global_rule import GlobalRule
 from src.core.generation.domain.memory_models import ConversationSummary, UserFact
-from src.core.ingestion.domain.chunk import EmbeddingStatus
+from src.core.ingestion.domain.chunk import Chunk, EmbeddingStatus
 from src.core.ingestion.domain.document import Document
 from src.core.ingestion.domain.folder import Folder
 from src.core.state.machine import DocumentStatus
 from src.core.tenants.domain.tenant import Tenant
+from src.shared.kernel.runtime import _reset_for_tests, configure_settings
+
+# Frozen timestamp keeps fixture rows (and the generated archive) deterministic
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
 
 
 async def mock_aiter(items):
@@ -38,28 +43,76 @@ async def mock_session():
     return session
 
 
+class FakeStorage:
+    """In-memory StoragePort: returns what was uploaded, records content types."""
+
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+        self.content_types: dict[str, str] = {}
+
+    def upload_file(self, object_name: str, data, length: int, content_type: str) -> None:
+        self.files[object_name] = data.read() if hasattr(data, "read") else bytes(data)
+        self.content_types[object_name] = content_type
+
+    def get_file(self, object_name: str) -> bytes:
+        try:
+            return self.files[object_name]
+        except KeyError:
+            raise FileNotFoundError(object_name) from None
+
+    def delete_file(self, object_name: str) -> None:
+        self.files.pop(object_name, None)
+        self.content_types.pop(object_name, None)
+
+
 @pytest_asyncio.fixture
 async def mock_storage():
-    storage = MagicMock()
-    storage.upload_file = MagicMock()
-    storage.get_file = MagicMock()
-    storage.delete_file = MagicMock()
-    return storage
+    return FakeStorage()
+
+
+@pytest.fixture
+def mock_graph_client():
+    client = MagicMock()
+    client.export_graph.side_effect = lambda *a, **k: mock_aiter([{"id": "g1"}])
+    client.import_graph = AsyncMock(return_value={"nodes_created": 1})
+    return client
+
+
+@pytest.fixture
+def mock_vector_store():
+    store = MagicMock()
+    store.export_vectors.side_effect = lambda *a, **k: mock_aiter([{"id": "v1"}])
+    store.import_vectors = AsyncMock(return_value=10)
+    store.close = AsyncMock()
+    return store
 
 
 @pytest_asyncio.fixture
-async def backup_service(mock_session, mock_storage):
-    return BackupService(mock_session, mock_storage)
+async def backup_service(mock_session, mock_storage, mock_graph_client, mock_vector_store):
+    return BackupService(
+        mock_session, mock_storage, mock_graph_client, MagicMock(return_value=mock_vector_store)
+    )
 
 
 @pytest_asyncio.fixture
-async def restore_service(mock_session, mock_storage):
-    return RestoreService(mock_session, mock_storage)
+async def restore_service(mock_session, mock_storage, mock_graph_client, mock_vector_store):
+    return RestoreService(
+        mock_session, mock_storage, mock_graph_client, MagicMock(return_value=mock_vector_store)
+    )
 
 
 # --- Tests for BackupService ---
 
 
+def test_is_compressed_mime_types():
+    assert _is_compressed("application/pdf")
+    assert _is_compressed("image/jpeg")
+    assert _is_compressed("video/mp4")
+    assert not _is_compressed("text/plain")
+    assert not _is_compressed("application/json")
+    assert not _is_compressed(None)
+
+
 @pytest.mark.asyncio
 async def test_create_backup_user_data(backup_service, mock_session, mock_storage):
     # Setup mock data using proper SQLAlchemy models
@@ -73,13 +126,11 @@ async def test_create_backup_user_data(backup_service, mock_session, mock_storag
         storage_path="path/to/doc.pdf",
         status=DocumentStatus.INGESTED,
         metadata_={"mime_type": "application/pdf", "file_size": 1024},
-        created_at=datetime.now(UTC),
+        created_at=_FIXED_TS,
     )
 
     # 2. Folders
-    folder = Folder(
-        id="folder_1", tenant_id="tenant_1", name="Documents", created_at=datetime.now(UTC)
-    )
+    folder = Folder(id="folder_1", tenant_id="tenant_1", name="Documents", created_at=_FIXED_TS)
 
     # 3. Conversations
     conv = ConversationSummary(
@@ -88,7 +139,7 @@ async def test_create_backup_user_data(backup_service, mock_session, mock_storag
         user_id="user_1",
         title="Test Chat",
         summary="Summary",
-        created_at=datetime.now(UTC),
+        created_at=_FIXED_TS,
     )
 
     # 4. User Facts
@@ -98,18 +149,9 @@ async def test_create_backup_user_data(backup_service, mock_session, mock_storag
         user_id="user_1",
         content="User likes AI",
         importance=5,
-        created_at=datetime.now(UTC),
+        created_at=_FIXED_TS,
     )
 
-    # Configure session execute side effects to return data in order of calls
-    # Order in BackupService.create_backup:
-    # 1. Documents (metadata)
-    # 2. Folders
-    # 3. Documents (files)
-    # 4. Conversations
-    # 5. User Facts
-    # 6. Conversation Summaries (not implemented yet/reuses logic)
-
     result_mock_docs = MagicMock()
     result_mock_docs.scalars.return_value.all.return_value = [doc]
 
@@ -125,51 +167,39 @@ async def test_create_backup_user_data(backup_service, mock_session, mock_storag
     result_mock_chunks = MagicMock()
     result_mock_chunks.scalars.return_value.all.return_value = []
 
-    # BackupService:
-    # 1. _add_documents_metadata -> select(Document)
-    # 2. _add_folders -> select(Folder)
-    # 3. _add_document_files -> select(Document)
-    # 4. _add_conversations -> select(ConversationSummary)
-    # 5. _add_user_facts -> select(UserFact)
-    # 6. _add_conversation_summaries (pass)
+    result_mock_tenant = MagicMock()
+    result_mock_tenant.scalar_one_or_none.return_value = None
 
-    mock_session.execute.side_effect = [
-        result_mock_docs,  # Metadata
-        result_mock_folders,  # Folders
-        result_mock_docs,  # Files
-        result_mock_conv,  # Conversations
-        result_mock_facts,  # Facts
-        result_mock_chunks,  # Chunks
-    ]
+    # Dispatch on the selected entity so the test does not depend on the
+    # order in which BackupService issues its queries.
+    results_by_entity = {
+        Document: result_mock_docs,
+        Folder: result_mock_folders,
+        ConversationSummary: result_mock_conv,
+        UserFact: result_mock_facts,
+        Chunk: result_mock_chunks,
+        Tenant: result_mock_tenant,
+    }
 
-    # Mock storage file retrieval
-    mock_storage.get_file.return_value = b"fake-pdf-content"
+    def dispatch(stmt, *args, **kwargs):
+        return results_by_entity[stmt.column_descriptions[0]["entity"]]
 
-    # Patch platform for Vectors/Graph
-    with patch("src.amber_platform.composition_root.platform") as mock_platform:
-        # Mock iterators using side_effect to return fresh generators
-        mock_platform.milvus_vector_store.export_vectors.side_effect = lambda *a, **k: mock_aiter(
-            [{"id": "v1"}]
-        )
-        mock_platform.neo4j_client.export_graph.side_effect = lambda *a, **k: mock_aiter(
-            [{"id": "g1"}]
-        )
+    mock_session.execute.side_effect = dispatch
 
-        # Execute
-        path, size = await backup_service.create_backup(
-            tenant_id="tenant_1", job_id="job_1", scope=BackupScope.USER_DATA
-        )
+    mock_storage.files["path/to/doc.pdf"] = b"fake-pdf-content"
+
+    # Execute
+    path, size = await backup_service.create_backup(
+        tenant_id="tenant_1", job_id="job_1", scope=BackupScope.USER_DATA
+    )
 
     # Asserts
     assert path == "backups/tenant_1/job_1/backup.zip"
     assert size > 0
-    mock_storage.upload_file.assert_called_once()
-
-    # Verify ZIP content (inspect the arguments passed to mock_storage.upload_file)
-    call_args = mock_storage.upload_file.call_args
-    uploaded_data = call_args.kwargs["data"]
+    assert mock_storage.content_types[path] == "application/zip"
 
-    with zipfile.ZipFile(uploaded_data, "r") as zf:
+    # Verify ZIP content as stored
+    with zipfile.ZipFile(io.BytesIO(mock_storage.files[path]), "r") as zf:
         namelist = zf.namelist()
         assert "manifest.json" in namelist
         assert "documents/metadata.json" in namelist
@@ -187,11 +217,61 @@ async def test_create_backup_user_data(backup_service, mock_session, mock_storag
         assert meta_json[0]["mime_type"] == "application/pdf"  # This verifies our fix
 
 
+@pytest.mark.asyncio
+async def test_add_vectors_writes_sparse_vector_keys_as_strings(backup_service, mock_vector_store):
+    # Milvus returns SPARSE_FLOAT_VECTOR fields as dict[int, float]
+    record = {"id": "v1", "vector": [0.1, 0.2], "sparse_vector": {3: 0.5, 17: 1.25}}
+    mock_vector_store.export_vectors.side_effect = lambda *a, **k: mock_aiter([record])
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        await backup_service._add_vectors(zf, "tenant_1")
+
+    with zipfile.ZipFile(buffer) as zf:
+        lines = zf.read("vectors/vectors.jsonl").splitlines()
+
+    assert [json.loads(line) for line in lines] == [json.loads(json.dumps(record))]
+    mock_vector_store.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_tenant_rows_uses_session_per_query(mock_session, mock_storage):
+    opened = []
+
+    def session_factory():
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        session.execute.return_value = result
+        session.__aenter__.return_value = session
+        opened.append(session)
+        return session
+
+    service = BackupService(
+        mock_session, mock_storage, MagicMock(), MagicMock(), session_factory=session_factory
+    )
+
+    rows = await service._fetch_tenant_rows("tenant_1", BackupScope.FULL_SYSTEM)
+
+    assert set(rows) == {
+        Document,
+        Folder,
+        ConversationSummary,
+        UserFact,
+        Chunk,
+        GlobalRule,
+        BackupSchedule,
+    }
+    assert len(opened) == len(rows)
+    assert all(session.execute.await_count == 1 for session in opened)
+    mock_session.execute.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_restore_backup(restore_service, mock_session, mock_storage):
     # Prepare a fake backup zip
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zf:
         # Manifest
         manifest = {
             "version": "1.0",
@@ -223,8 +303,7 @@ async def test_restore_backup(restore_service, mock_session, mock_storage):
         # File content
         zf.writestr("documents/files/root/restored.pdf", b"restored content")
 
-    zip_buffer.seek(0)
-    mock_storage.get_file.return_value = zip_buffer.getvalue()
+    mock_storage.files["backup_1"] = zip_buffer.getvalue()
 
     # Mock session.add as synchronous MagicMock
     mock_session.add = MagicMock()
@@ -267,9 +346,8 @@ async def test_restore_backup(restore_service, mock_session, mock_storage):
     assert mock_session.add.call_count >= 1
 
     # Verify file upload (restoring file content)
-    assert mock_storage.upload_file.call_count >= 1
-    call_args = mock_storage.upload_file.call_args
-    assert call_args.kwargs["content_type"] == "application/pdf"
+    assert mock_storage.files["path/old.pdf"] == b"restored content"
+    assert mock_storage.content_types["path/old.pdf"] == "application/pdf"
 
 
 @pytest.mark.asyncio
@@ -303,8 +381,7 @@ async def test_restore_full_system_config(restore_service, mock_session, mock_st
             ),
         )
 
-    zip_buffer.seek(0)
-    mock_storage.get_file.return_value = zip_buffer.getvalue()
+    mock_storage.files["backup_sys"] = zip_buffer.getvalue()
 
     # Mock mocks
     mock_session.add = MagicMock()
@@ -366,7 +443,9 @@ async def test_restore_full_system_config(restore_service, mock_session, mock_st
 
 
 @pytest.mark.asyncio
-async def test_restore_extended_components(restore_service, mock_session, mock_storage, caplog):
+async def test_restore_extended_components(
+    restore_service, mock_session, mock_storage, mock_graph_client, mock_vector_store, caplog
+):
     """Test chunks, vectors, graph, and dump restore."""
     # ZIP content
     zip_buffer = io.BytesIO()
@@ -398,30 +477,24 @@ async def test_restore_extended_components(restore_service, mock_session, mock_s
         # Graph
         zf.writestr("graph/graph.jsonl", json.dumps({"type": "node", "id": "n1"}) + "\n")
 
-    zip_buffer.seek(0)
-    mock_storage.get_file.return_value = zip_buffer.getvalue()
+    mock_storage.files["backup_ext"] = zip_buffer.getvalue()
 
     # Mock Chunks check
     mock_session.execute.return_value.scalar_one_or_none.return_value = None  # No existing chunk
     mock_session.add = MagicMock()  # Ensure sync mock for add
 
-    # Mock Platform
-    with patch("src.amber_platform.composition_root.platform") as mock_platform:
-        mock_platform.milvus_vector_store.import_vectors = AsyncMock(return_value=10)
-        mock_platform.neo4j_client.import_graph = AsyncMock(return_value={"nodes_created": 1})
-
-        await restore_service.restore("backup_ext", "t1", RestoreMode.MERGE)
+    await restore_service.restore("backup_ext", "t1", RestoreMode.MERGE)
 
-        # Verify Chunks
-        # Check logs if failed
-        errors = [r.message for r in caplog.records if r.levelname in ("WARNING", "ERROR")]
-        assert mock_session.add.call_count >= 1, f"Session add not called. Errors: {errors}"
+    # Verify Chunks
+    # Check logs if failed
+    errors = [r.message for r in caplog.records if r.levelname in ("WARNING", "ERROR")]
+    assert mock_session.add.call_count >= 1, f"Session add not called. Errors: {errors}"
 
-        # Verify Vectors
-        mock_platform.milvus_vector_store.import_vectors.assert_called_once()
+    # Verify Vectors
+    mock_vector_store.import_vectors.assert_called_once()
 
-        # Verify Graph
-        mock_platform.neo4j_client.import_graph.assert_called_once()
+    # Verify Graph
+    mock_graph_client.import_graph.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -436,20 +509,22 @@ async def test_restore_postgres_dump(restore_service, mock_session, mock_storage
         )
         zf.writestr("database/postgres_dump.sql", b"SQL DUMP CONTENT")
 
-    zip_buffer.seek(0)
-    mock_storage.get_file.return_value = zip_buffer.getvalue()
+    mock_storage.files["backup_dump"] = zip_buffer.getvalue()
 
     # Patch subprocess
     with patch("src.core.admin_ops.application.restore_service.subprocess.run") as mock_run:
         mock_run.return_value.returncode = 0
 
-        # Patch settings
-        with patch("src.api.config.settings") as mock_settings:
-            mock_settings.db.database_url = "postgresql://u:p@h:5432/db"
-
+        # Runtime settings supply the database URL
+        configure_settings(
+            SimpleNamespace(db=SimpleNamespace(database_url="postgresql://u:p@h:5432/db"))
+        )
+        try:
             await restore_service.restore("backup_dump", "t1", RestoreMode.REPLACE)
+        finally:
+            _reset_for_tests()
 
-            mock_run.assert_called_once()
-            args = mock_run.call_args[0][0]
-            assert args[0] == "psql"
-            assert "-f" in args
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[0] == "psql"
+        assert "-f" in args
@@ -2,12 +2,13 @@
 
 import asyncio
 import os
+from pathlib import Path
 
 import pytest
 import pytest_asyncio
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from src.core.database.session import configure_database
 
@@ -37,6 +38,57 @@ from src.api.main import app
 from src.core.admin_ops.domain.api_key import ApiKey, ApiKeyTenant
 from src.shared.security import generate_api_key, hash_api_key
 
+# Backing services started by the optional compose fixture. Milvus pulls in
+# etcd through its own depends_on entry.
+COMPOSE_SERVICES = ["postgres", "redis", "neo4j", "garage", "milvus"]
+
+
+_INTEGRATION_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Pin every integration test to one pytest-xdist worker.
+
+    All of them share TEST_TENANT_ID, and cleanup_test_tenant wipes that
+    tenant before and after each test, so they must not run concurrently.
+    """
+    group = pytest.mark.xdist_group("integration")
+    for item in items:
+        if item.path.is_relative_to(_INTEGRATION_DIR):
+            item.add_marker(group)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def integration_services():
+    """
+    Start the backing services with a single `docker compose up -d --wait`.
+
+    Opt-in via AMBER_TEST_COMPOSE=1; by default the suite expects the services
+    to be running already. All containers start in parallel and are left up
+    after the session so the next run reuses them; set AMBER_TEST_COMPOSE_DOWN=1
+    to stop them on teardown.
+    """
+    if os.getenv("AMBER_TEST_COMPOSE") != "1":
+        yield None
+        return
+
+    from testcontainers.compose import DockerCompose
+
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    compose = DockerCompose(
+        repo_root,
+        compose_file_name="docker-compose.yml",
+        services=COMPOSE_SERVICES,
+        wait=True,
+    )
+    compose.start()
+    try:
+        yield compose
+    finally:
+        if os.getenv("AMBER_TEST_COMPOSE_DOWN") == "1":
+            compose.stop(down=False)
+
 
 @pytest.fixture(scope="function", autouse=True)
 def initialize_application():
@@ -77,6 +129,33 @@ def initialize_application():
     )
 
 
+@pytest_asyncio.fixture
+async def neo4j():
+    """
+    Connected platform Neo4j client for one test.
+
+    Function-scoped on purpose: the driver's pooled Bolt connections belong to
+    the test's event loop, and the root conftest drops the platform client
+    after every test.
+    """
+    from src.amber_platform.composition_root import platform
+
+    client = platform.neo4j_client
+    await client.connect()
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="session")
+def celery():
+    """Celery app with its task registry loaded once per session."""
+    from src.workers.celery_app import celery_app
+
+    # Touch the registry so autodiscovery runs here rather than in a test
+    _ = celery_app.tasks
+    return celery_app
+
+
 @pytest.fixture
 def test_tenant_id():
     """Return the isolated tenant ID for tests."""
@@ -191,17 +270,28 @@ async def cleanup_test_tenant():
     await _wipe()
 
 
+@pytest.fixture(scope="session")
+def asgi_transport():
+    """
+    ASGI transport for the app, shared by the whole session.
+
+    ASGITransport does not run the app lifespan and holds no loop-bound
+    state, so one instance can serve clients on every test's loop.
+    """
+    from httpx import ASGITransport
+
+    return ASGITransport(app=app)
+
+
 @pytest_asyncio.fixture
-async def client(monkeypatch):
+async def client(asgi_transport):
     """Create test client with enforced Tenant ID."""
-    from httpx import ASGITransport, AsyncClient
+    from httpx import AsyncClient
 
     # Enforce Tenant ID in headers
     headers = {"X-Tenant-ID": TEST_TENANT_ID}
 
-    # Use app directly (assuming startup events are handled globally or not strictly needed for these tests)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test", headers=headers) as c:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test", headers=headers) as c:
         yield c
 
 
@@ -215,9 +305,13 @@ def api_key():
         raw_key = generate_api_key(prefix="test")
         hashed = hash_api_key(raw_key)
 
-        # 2. Setup Async Engine
-        engine = create_async_engine(settings.db.database_url)
-        AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        # 2. Setup Async Engine (one-shot: no pool, no prepared-statement cache)
+        engine = create_async_engine(
+            settings.db.database_url,
+            poolclass=NullPool,
+            connect_args={"statement_cache_size": 0},
+        )
+        AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
         async with AsyncSessionLocal() as session:
             try:
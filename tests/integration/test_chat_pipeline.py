@@ -1,9 +1,11 @@
 # 1. Environment Overrides
 # ----------------------------------------------------------------------
+import itertools
 import os
 import sys
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Sequence
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
@@ -25,11 +27,12 @@ if not os.getenv("MILVUS_HOST"):
 os.environ["OPENAI_API_KEY"] = "sk-test-key-mock"
 
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
+from sqlalchemy import insert, text
 
 # ----------------------------------------------------------------------
 # 2. Application Imports
 # ----------------------------------------------------------------------
+import src.core.database.session as session_module
 from src.api.main import app
 from src.core.database.session import (
     close_database,
@@ -37,6 +40,7 @@ from src.core.database.session import (
     get_session_maker,
 )
 from src.core.generation.domain.memory_models import ConversationSummary, UserFact
+from src.core.generation.domain.ports.provider_factory import set_provider_factory_builder
 from src.core.generation.infrastructure.providers.base import (
     GenerationResult as LLMGenerationResult,
 )
@@ -46,80 +50,250 @@ from src.core.ingestion.domain.document import Document
 from src.core.retrieval.infrastructure.vector_store.milvus import SearchResult
 from src.core.state.machine import DocumentStatus
 
-
 # ----------------------------------------------------------------------
-# 3. Test Class
+# 3. Shared Mock Data
 # ----------------------------------------------------------------------
-class TestChatPipelineComprehensive:
-    """
-    Comprehensive integration tests for Chat logic.
-    Mocking external AI services to focus on pipeline logic.
-    """
+_STATIC_LLM_RESULT = LLMGenerationResult(
+    text="I am a mocked LLM response.",
+    model="mock-model",
+    provider="mock-provider",
+    usage=TokenUsage(input_tokens=5, output_tokens=5),
+    cost_estimate=0.0,
+)
 
-    @pytest_asyncio.fixture(autouse=True)
-    async def setup_dependencies(self):
-        """Mock all external dependencies securely with proper teardown."""
-
-        # 6. LLM
-        self.mock_llm = AsyncMock()
-        self.mock_llm.model_name = "mock-model"
-        self.mock_llm.provider_name = "mock-provider"
-        self.mock_llm.generate.return_value = LLMGenerationResult(
-            text="I am a mocked LLM response.",
-            model="mock-model",
-            provider="mock-provider",
-            usage=TokenUsage(input_tokens=5, output_tokens=5),
-            cost_estimate=0.0,
-        )
+_MOCK_STREAM_TOKENS = ("Mocked", " ", "Stream", " ", "[DONE]")
 
-        # Streaming mock
-        async def mock_stream(*args, **kwargs):
-            yield "Mocked"
-            yield " "
-            yield "Stream"
-            yield " "
-            yield "[DONE]"
+# Ids are a per-process random token plus a counter: the token keeps rows
+# from concurrent pytest-xdist workers apart, the counter keeps ids cheap.
+_ID_TOKEN = uuid.uuid4().hex[:8]
+_ID_SEQ = itertools.count()
 
-        self.mock_llm.generate_stream = mock_stream
 
-        # Track started patches for cleanup
-        patches = []
+async def _mock_stream(*args, **kwargs):
+    for token in _MOCK_STREAM_TOKENS:
+        yield token
 
-        # 0. Provider Factory Patch (Global)
-        self.mock_factory = MagicMock()
 
-        # Helper to create a provider mock with string attributes instead of AsyncMocks
-        def create_provider_mock(name, model):
-            m = AsyncMock()
-            m.provider_name = name
-            m.model_name = model
-            m.default_model = model
-            m.get_default_model.return_value = model
-            return m
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def _class_env(request):
+    """
+    Build the immutable mock graph once per class, on ``request.cls``.
 
-        mock_embed_provider = create_provider_mock("openai", "text-embedding-3-small")
-        self.mock_factory.get_embedding_provider.return_value = mock_embed_provider
+    Patches, the database engine and the composed services are shared by
+    every test; per-test state is reset in ``setup_dependencies``.
+    """
+    cls = request.cls
+
+    # 6. LLM
+    cls.mock_llm = AsyncMock()
+    cls.mock_llm.model_name = "mock-model"
+    cls.mock_llm.provider_name = "mock-provider"
+
+    cls.mock_llm.generate_stream = _mock_stream
+
+    # Plain attribute swaps, undone once at class teardown
+    mp = pytest.MonkeyPatch()
+
+    # 0. Provider Factory Patch (Global)
+    cls.mock_factory = MagicMock()
+
+    # Helper to create a provider mock with string attributes instead of AsyncMocks
+    def create_provider_mock(name, model):
+        m = AsyncMock()
+        m.provider_name = name
+        m.model_name = model
+        m.default_model = model
+        m.get_default_model.return_value = model
+        return m
+
+    mock_embed_provider = create_provider_mock("openai", "text-embedding-3-small")
+    cls.mock_factory.get_embedding_provider.return_value = mock_embed_provider
+
+    cls.mock_factory.get_llm_provider.return_value = cls.mock_llm
+
+    mock_rerank_provider = create_provider_mock("flashrank", "bge-reranker-v2-m3")
+    cls.mock_factory.get_reranker_provider.return_value = mock_rerank_provider
+
+    # 0.1 Configure Database explicitly -> Reset Platform first
+    from src.amber_platform.composition_root import platform
+
+    # Force reset platform to ensure fresh clients in this class' loop
+    platform._neo4j_client = None
+    platform._minio_client = None
+    platform._redis_client = None
+    platform._initialized = False
+
+    await close_database()
+    configure_database(database_url=os.environ["DATABASE_URL"], pool_size=5, max_overflow=10)
+    # Build the engine once; setup_dependencies re-installs it after the
+    # global cleanup fixture drops the module-level reference.
+    cls._session_maker = get_session_maker()
+    cls._engine = session_module.get_engine()
+    # The function-loop cleanup_test_tenant wipe runs before the first
+    # test; keep the class engine out of the module globals until
+    # setup_dependencies installs it for that test
+    import src.api.deps as deps_module
+
+    session_module._engine = None
+    session_module._async_session_maker = None
+    deps_module._async_session_maker = None
+
+    # 1. Vector Store
+    cls.mock_vector_store = MagicMock()
+    mp.setattr(
+        "src.core.retrieval.infrastructure.vector_store.milvus.MilvusVectorStore",
+        lambda *args, **kwargs: cls.mock_vector_store,
+    )
+    cls.mock_vector_store.search = AsyncMock(return_value=[])
+    cls.mock_vector_store.disconnect = AsyncMock()
+
+    # 2. Embedding
+    from src.core.retrieval.application.embeddings_service import EmbeddingService
+
+    cls.mock_embed_service = MagicMock(spec=EmbeddingService)
+    cls.mock_embed_service.embed_single = AsyncMock(return_value=[0.1] * 1536)
+
+    # 3. Reranker
+    from src.core.generation.infrastructure.providers.base import BaseRerankerProvider
+
+    cls.mock_reranker = MagicMock(spec=BaseRerankerProvider)
+
+    # 3.1 Caches (Must be patched BEFORE RetrievalService init)
+    cls.mock_result_cache = MagicMock()
+    cls.mock_result_cache.get = AsyncMock(return_value=None)
+    cls.mock_result_cache.set = AsyncMock()
+    mp.setattr(
+        "src.core.retrieval.application.retrieval_service.ResultCache",
+        lambda *args, **kwargs: cls.mock_result_cache,
+    )
+
+    cls.mock_semantic_cache = MagicMock()
+    cls.mock_semantic_cache.get = AsyncMock(return_value=None)
+    cls.mock_semantic_cache.set = AsyncMock()
+    mp.setattr(
+        "src.core.retrieval.application.retrieval_service.SemanticCache",
+        lambda *args, **kwargs: cls.mock_semantic_cache,
+    )
+
+    # 4. Retrieval Service
+    from src.core.generation.infrastructure.providers.base import ProviderTier
+    from src.core.retrieval.application.retrieval_service import RetrievalService
+
+    mock_config = MagicMock(enable_reranking=False, enable_hybrid=False, top_k=5)
+    mock_config.llm_tier = ProviderTier.ECONOMY
+    cls.mock_neo4j = AsyncMock()  # Neo4j client mock
+
+    from src.core.ingestion.domain.ports.document_repository import DocumentRepository
+
+    cls.mock_doc_repo = MagicMock(spec=DocumentRepository)
+    cls.mock_doc_repo.get_chunks = AsyncMock(return_value=[])
+
+    # RetrievalService resolves its providers through the factory builder
+    set_provider_factory_builder(lambda **kwargs: cls.mock_factory)
+
+    cls.retrieval_service = RetrievalService(
+        document_repository=cls.mock_doc_repo,
+        vector_store=cls.mock_vector_store,
+        neo4j_client=cls.mock_neo4j,
+        openai_api_key="test",
+        config=mock_config,
+    )
+    cls.retrieval_service.embedding_service = cls.mock_embed_service
+    cls.retrieval_service.reranker = None
+
+    # 7. Generation Service
+    from src.core.generation.application.generation_service import GenerationService
+
+    cls.generation_service = GenerationService(llm_provider=cls.mock_llm)
+
+    # 8. Swap Composition Root Builders (the query routes import them lazily,
+    # so there is no FastAPI dependency to override)
+    mp.setattr(
+        "src.amber_platform.composition_root.build_retrieval_service",
+        lambda *args, **kwargs: cls.retrieval_service,
+    )
+    mp.setattr(
+        "src.amber_platform.composition_root.build_generation_service",
+        lambda *args, **kwargs: cls.generation_service,
+    )
+
+    cls.mock_metrics_collector = MagicMock()
+    cls.mock_metrics_collector.track_query.return_value.__aenter__.return_value = MagicMock()
+    mp.setattr(
+        "src.amber_platform.composition_root.build_metrics_collector",
+        lambda *args, **kwargs: cls.mock_metrics_collector,
+    )
+
+    # 9. Graph Writer & Context
+    mp.setattr("src.core.graph.application.context_writer.context_graph_writer", MagicMock())
+
+    # 10. Auth / ApiKeyService
+    mock_auth_service = MagicMock()
+    mp.setattr(
+        "src.core.admin_ops.application.api_key_service.ApiKeyService",
+        lambda *args, **kwargs: mock_auth_service,
+    )
+
+    mock_key = MagicMock()
+    mock_key.id = "test-key-id"
+    mock_key.name = "Test Key"
+    mock_key.scopes = ["admin"]
+    mock_tenant = MagicMock()
+    mock_tenant.id = cls.tenant_id
+    mock_key.tenants = [mock_tenant]
+    mock_auth_service.validate_key = AsyncMock(return_value=mock_key)
+
+    try:
+        yield
+    finally:
+        # TEARDOWN: Undo all swaps to prevent loop leak
+        mp.undo()
+
+        # Close DB
+        session_module._engine = cls._engine
+        await close_database()
 
-        self.mock_factory.get_llm_provider.return_value = self.mock_llm
+        # Reset platform
+        platform._neo4j_client = None
+        platform._initialized = False
 
-        mock_rerank_provider = create_provider_mock("flashrank", "bge-reranker-v2-m3")
-        self.mock_factory.get_reranker_provider.return_value = mock_rerank_provider
 
-        p = patch(
-            "src.core.generation.domain.ports.provider_factory._provider_factory_builder",
-            return_value=self.mock_factory,
-        )
-        self.patch_factory_builder = p.start()
-        patches.append(p)
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def _shared_client():
+    """One AsyncClient for the whole class.
 
-        # 0.1 Configure Database explicitly -> Reset Platform first
-        from src.amber_platform.composition_root import platform
+    ASGITransport never runs the app lifespan, so sharing it only saves
+    the per-test client/transport setup and teardown.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
-        # Force reset platform to ensure fresh clients in this tests' loop
-        platform._neo4j_client = None
-        platform._minio_client = None
-        platform._redis_client = None
-        platform._initialized = False
+
+# ----------------------------------------------------------------------
+# 4. Test Class
+# ----------------------------------------------------------------------
+@pytest.mark.asyncio(loop_scope="class")
+class TestChatPipelineComprehensive:
+    """
+    Comprehensive integration tests for Chat logic.
+    Mocking external AI services to focus on pipeline logic.
+    """
+
+    tenant_id = "integration_test_tenant"
+
+    @pytest_asyncio.fixture(autouse=True, loop_scope="class")
+    async def setup_dependencies(self, _class_env):
+        """Reset per-test state on top of the shared class environment."""
+        # The global cleanup fixture drops these after every test
+        session_module._engine = self._engine
+        session_module._async_session_maker = self._session_maker
+        set_provider_factory_builder(lambda **kwargs: self.mock_factory)
+
+        self.mock_llm.generate.reset_mock()
+        self.mock_llm.generate.return_value = _STATIC_LLM_RESULT
+        self.mock_vector_store.search.reset_mock()
+        self.mock_vector_store.search.return_value = []
 
         # Reset Rate Limiter singleton to avoid loop mismatch
         import src.api.middleware.rate_limit as rate_limit_module
@@ -131,96 +305,7 @@ class TestChatPipelineComprehensive:
 
         deps_module._async_session_maker = None
 
-        await close_database()
-        configure_database(database_url=os.environ["DATABASE_URL"], pool_size=5, max_overflow=10)
-
-        # 1. Vector Store
-        p = patch("src.core.retrieval.infrastructure.vector_store.milvus.MilvusVectorStore")
-        self.mock_vector_store_cls = p.start()
-        patches.append(p)
-        self.mock_vector_store = self.mock_vector_store_cls.return_value
-        self.mock_vector_store.search = AsyncMock(return_value=[])
-        self.mock_vector_store.disconnect = AsyncMock()
-
-        # 2. Embedding
-        from src.core.retrieval.application.embeddings_service import EmbeddingService
-
-        self.mock_embed_service = MagicMock(spec=EmbeddingService)
-        self.mock_embed_service.embed_single = AsyncMock(return_value=[0.1] * 1536)
-
-        # 3. Reranker
-        from src.core.generation.infrastructure.providers.base import BaseRerankerProvider
-
-        self.mock_reranker = MagicMock(spec=BaseRerankerProvider)
-
-        # 3.1 Caches (Must be patched BEFORE RetrievalService init)
-        p = patch("src.core.retrieval.application.retrieval_service.ResultCache")
-        self.mock_result_cache_cls = p.start()
-        patches.append(p)
-        self.mock_result_cache = self.mock_result_cache_cls.return_value
-        self.mock_result_cache.get = AsyncMock(return_value=None)
-        self.mock_result_cache.set = AsyncMock()
-
-        p = patch("src.core.retrieval.application.retrieval_service.SemanticCache")
-        self.mock_semantic_cache_cls = p.start()
-        patches.append(p)
-        self.mock_semantic_cache_cls.return_value.get = AsyncMock(return_value=None)
-        self.mock_semantic_cache_cls.return_value.set = AsyncMock()
-
-        # 4. Retrieval Service
-        from src.core.generation.infrastructure.providers.base import ProviderTier
-        from src.core.retrieval.application.retrieval_service import RetrievalService
-
-        mock_config = MagicMock(enable_reranking=False, enable_hybrid=False, top_k=5)
-        mock_config.llm_tier = ProviderTier.ECONOMY
-        self.mock_neo4j = AsyncMock()  # Neo4j client mock
-
-        from src.core.ingestion.domain.ports.document_repository import DocumentRepository
-
-        self.mock_doc_repo = MagicMock(spec=DocumentRepository)
-        self.mock_doc_repo.get_chunks = AsyncMock(return_value=[])
-
-        self.retrieval_service = RetrievalService(
-            document_repository=self.mock_doc_repo,
-            vector_store=self.mock_vector_store,
-            neo4j_client=self.mock_neo4j,
-            openai_api_key="test",
-            config=mock_config,
-        )
-        self.retrieval_service.embedding_service = self.mock_embed_service
-        self.retrieval_service.reranker = None
-
-        # 7. Generation Service
-        from src.core.generation.application.generation_service import GenerationService
-
-        self.generation_service = GenerationService(llm_provider=self.mock_llm)
-
-        # 8. Patch Composition Root Builders
-        p = patch(
-            "src.amber_platform.composition_root.build_retrieval_service",
-            return_value=self.retrieval_service,
-        )
-        self.patch_retrieval_builder = p.start()
-        patches.append(p)
-
-        p = patch(
-            "src.amber_platform.composition_root.build_generation_service",
-            return_value=self.generation_service,
-        )
-        self.patch_generation_builder = p.start()
-        patches.append(p)
-
-        self.mock_metrics_collector = MagicMock()
-        self.mock_metrics_collector.track_query.return_value.__aenter__.return_value = MagicMock()
-        p = patch(
-            "src.amber_platform.composition_root.build_metrics_collector",
-            return_value=self.mock_metrics_collector,
-        )
-        self.patch_metrics_builder = p.start()
-        patches.append(p)
-
-        self.tenant_id = "integration_test_tenant"
-        self.user_id = f"user_{uuid.uuid4().hex[:8]}"
+        self.user_id = f"user_{_ID_TOKEN}_{next(_ID_SEQ):08x}"
 
         # 8. Reset Singleton Services in Query Route
         import src.api.routes.query as query_routes
@@ -229,26 +314,6 @@ class TestChatPipelineComprehensive:
         query_routes._generation_service = None
         query_routes._metrics_collector = None
 
-        # 9. Graph Writer & Context
-        p = patch("src.core.graph.application.context_writer.context_graph_writer")
-        p.start()
-        patches.append(p)
-
-        # 10. Auth / ApiKeyService
-        p = patch("src.core.admin_ops.application.api_key_service.ApiKeyService")
-        self.mock_api_key_service_cls = p.start()
-        patches.append(p)
-        mock_auth_service = self.mock_api_key_service_cls.return_value
-
-        mock_key = MagicMock()
-        mock_key.id = "test-key-id"
-        mock_key.name = "Test Key"
-        mock_key.scopes = ["admin"]
-        mock_tenant = MagicMock()
-        mock_tenant.id = self.tenant_id
-        mock_key.tenants = [mock_tenant]
-        mock_auth_service.validate_key = AsyncMock(return_value=mock_key)
-
         # 11. Database Cleanup
         try:
             async_session = get_session_maker()
@@ -275,84 +340,111 @@ class TestChatPipelineComprehensive:
         except Exception:
             pass  # Ignore cleanup errors if DB not ready
 
-        try:
-            yield
-        finally:
-            # TEARDOWN: Stop all patches to prevent loop leak
-            for p in reversed(patches):
-                p.stop()
-
-            # Close DB
-            await close_database()
-
-            # Reset platform
-            platform._neo4j_client = None
-            platform._initialized = False
-
-    @pytest_asyncio.fixture
-    async def client(self):
-        # from asgi_lifespan import LifespanManager  <-- Removed to fix ModuleNotFoundError
+        yield
+
+        # The conftest cleanup_test_tenant wipe runs next, on the function
+        # loop; make it build its own engine rather than reuse the class
+        # engine, whose pooled connections belong to the class loop
+        session_module._engine = None
+        session_module._async_session_maker = None
+        deps_module._async_session_maker = None
+
+    @pytest_asyncio.fixture(loop_scope="class")
+    async def client(self, _shared_client):
+        # user_id changes per test, so headers are built here rather than
+        # baked into the shared client
         headers = {
             "X-API-Key": "test-key",
             "X-Tenant-ID": self.tenant_id,
             "X-User-ID": self.user_id,
         }
-        # Use ASGITransport directly matching test_retrieval.py
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            yield ac, headers
+        yield _shared_client, headers
 
     # ------------------------------------------------------------------
     # Helper
     # ------------------------------------------------------------------
-    async def _seed_document_and_chunk(self, content: str, filename: str = "seed.txt"):
-        doc_id = f"doc_{uuid.uuid4().hex[:8]}"
-        chunk_id = f"chunk_{uuid.uuid4().hex[:8]}"
+    async def _seed_many(
+        self,
+        session,
+        objects: Sequence[object] = (),
+        items: Sequence[tuple[str, str]] = (),
+    ) -> list[tuple[str, str, str]]:
+        """Stage ORM objects plus one READY document/chunk per (content, filename) pair.
+
+        Documents and chunks go through two executemany INSERTs, bypassing the
+        unit-of-work bookkeeping of ``session.add``. The caller commits.
+        """
+        session.add_all(objects)
+
+        docs_rows = []
+        chunks_rows = []
+        seeded = []
+        for content, filename in items:
+            seq = next(_ID_SEQ)
+            doc_id = f"doc_{_ID_TOKEN}_{seq:08x}"
+            chunk_id = f"chunk_{_ID_TOKEN}_{seq:08x}"
+            docs_rows.append(
+                {
+                    "id": doc_id,
+                    "tenant_id": self.tenant_id,
+                    "filename": filename,
+                    "content_hash": f"{_ID_TOKEN}{seq:024x}",
+                    "storage_path": "path",
+                    "status": DocumentStatus.READY,
+                }
+            )
+            chunks_rows.append(
+                {
+                    "id": chunk_id,
+                    "tenant_id": self.tenant_id,
+                    "document_id": doc_id,
+                    "index": 0,
+                    "content": content[:1000],
+                    "tokens": len(content.split()),
+                    "embedding_status": "completed",
+                    "metadata_": {},
+                }
+            )
+            seeded.append((doc_id, chunk_id, content))
+
+        if docs_rows:
+            await session.execute(insert(Document), docs_rows)
+            await session.execute(insert(Chunk), chunks_rows)
+
+        return seeded
 
+    async def _seed_documents_and_chunks(self, items: list[tuple[str, str]]):
         async_session = get_session_maker()
         async with async_session() as session:
-            doc = Document(
-                id=doc_id,
-                tenant_id=self.tenant_id,
-                filename=filename,
-                content_hash=uuid.uuid4().hex,
-                storage_path="path",
-                status=DocumentStatus.READY,
-            )
-            session.add(doc)
-            chunk = Chunk(
-                id=chunk_id,
-                tenant_id=self.tenant_id,
-                document_id=doc_id,
-                index=0,
-                content=content[:1000],
-                tokens=len(content.split()),
-                embedding_status="completed",
-                metadata_={},
-            )
-            session.add(chunk)
+            seeded = await self._seed_many(session, items=items)
             await session.commit()
+        return seeded
 
-        return doc_id, chunk_id, content
+    async def _seed_document_and_chunk(self, content: str, filename: str = "seed.txt"):
+        (seeded,) = await self._seed_documents_and_chunks([(content, filename)])
+        return seeded
+
+    def _make_result(
+        self, chunk_id: str, doc_id: str, content: str, score: float = 0.9
+    ) -> SearchResult:
+        """Build a vector-store hit for a seeded chunk."""
+        return SearchResult(
+            chunk_id=chunk_id,
+            document_id=doc_id,
+            tenant_id=self.tenant_id,
+            score=score,
+            metadata={"content": sys.intern(content)},
+        )
 
     # ------------------------------------------------------------------
     # TESTS
     # ------------------------------------------------------------------
-    @pytest.mark.asyncio
     async def test_basic_rag(self, client):
         ac, headers = client
         secret = "The code is 1234."
         doc_id, chunk_id, content = await self._seed_document_and_chunk(secret)
 
-        self.mock_vector_store.search.return_value = [
-            SearchResult(
-                chunk_id=chunk_id,
-                document_id=doc_id,
-                tenant_id=self.tenant_id,
-                score=0.9,
-                metadata={"content": content},
-            )
-        ]
+        self.mock_vector_store.search.return_value = [self._make_result(chunk_id, doc_id, content)]
 
         await ac.post(
             "/v1/query", json={"query": "Code?", "user_id": self.user_id}, headers=headers
@@ -361,27 +453,15 @@ class TestChatPipelineComprehensive:
         call_args = str(self.mock_llm.generate.call_args)
         assert secret in call_args
 
-    @pytest.mark.asyncio
     async def test_multi_doc_synthesis(self, client):
         ac, headers = client
-        d1, c1, t1 = await self._seed_document_and_chunk("Part A: Fire.", "a.txt")
-        d2, c2, t2 = await self._seed_document_and_chunk("Part B: Water.", "b.txt")
+        (d1, c1, t1), (d2, c2, t2) = await self._seed_documents_and_chunks(
+            [("Part A: Fire.", "a.txt"), ("Part B: Water.", "b.txt")]
+        )
 
         self.mock_vector_store.search.return_value = [
-            SearchResult(
-                chunk_id=c1,
-                document_id=d1,
-                tenant_id=self.tenant_id,
-                score=0.9,
-                metadata={"content": t1},
-            ),
-            SearchResult(
-                chunk_id=c2,
-                document_id=d2,
-                tenant_id=self.tenant_id,
-                score=0.9,
-                metadata={"content": t2},
-            ),
+            self._make_result(c1, d1, t1),
+            self._make_result(c2, d2, t2),
         ]
 
         await ac.post(
@@ -392,52 +472,38 @@ class TestChatPipelineComprehensive:
         assert "Part A: Fire" in call_args
         assert "Part B: Water" in call_args
 
-    @pytest.mark.asyncio
     async def test_context_window(self, client):
         ac, headers = client
         huge_content = "Word " * 5000
         d1, c1, _ = await self._seed_document_and_chunk(huge_content)
 
-        self.mock_vector_store.search.return_value = [
-            SearchResult(
-                chunk_id=c1,
-                document_id=d1,
-                tenant_id=self.tenant_id,
-                score=0.9,
-                metadata={"content": huge_content},
-            )
-        ]
+        self.mock_vector_store.search.return_value = [self._make_result(c1, d1, huge_content)]
 
         await ac.post("/v1/query", json={"query": "Test", "user_id": self.user_id}, headers=headers)
         call_args = str(self.mock_llm.generate.call_args)
         assert "Word" in call_args
 
-    @pytest.mark.asyncio
     async def test_history(self, client):
         ac, headers = client
         summary_text = "User previously asked about Project Alpha."
 
+        s = ConversationSummary(
+            id=str(uuid.uuid4()),
+            tenant_id=self.tenant_id,
+            user_id=self.user_id,
+            title="Previous Chat",
+            summary=summary_text,
+        )
+
         async_session = get_session_maker()
         async with async_session() as session:
-            s = ConversationSummary(
-                id=str(uuid.uuid4()),
-                tenant_id=self.tenant_id,
-                user_id=self.user_id,
-                title="Previous Chat",
-                summary=summary_text,
+            ((d_dummy, c_dummy, _),) = await self._seed_many(
+                session, objects=[s], items=[("Generic", "seed.txt")]
             )
-            session.add(s)
             await session.commit()
 
-        d_dummy, c_dummy, _ = await self._seed_document_and_chunk("Generic")
         self.mock_vector_store.search.return_value = [
-            SearchResult(
-                chunk_id=c_dummy,
-                document_id=d_dummy,
-                tenant_id=self.tenant_id,
-                score=0.5,
-                metadata={"content": "Generic content."},
-            )
+            self._make_result(c_dummy, d_dummy, "Generic content.", score=0.5)
         ]
 
         await ac.post(
@@ -446,7 +512,6 @@ class TestChatPipelineComprehensive:
         call_args = str(self.mock_llm.generate.call_args)
         assert summary_text in call_args
 
-    @pytest.mark.asyncio
     async def test_fallback(self, client):
         ac, headers = client
         self.mock_vector_store.search.return_value = []
@@ -456,18 +521,11 @@ class TestChatPipelineComprehensive:
         assert resp.status_code == 200
         assert "couldn't find" in resp.text
 
-    @pytest.mark.asyncio
     async def test_streaming(self, client):
         ac, headers = client
         d_dummy, c_dummy, _ = await self._seed_document_and_chunk("Streamable")
         self.mock_vector_store.search.return_value = [
-            SearchResult(
-                chunk_id=c_dummy,
-                document_id=d_dummy,
-                tenant_id=self.tenant_id,
-                score=0.5,
-                metadata={"content": "Streamable content."},
-            )
+            self._make_result(c_dummy, d_dummy, "Streamable content.", score=0.5)
         ]
         async with ac.stream(
             "POST",
@@ -481,31 +539,26 @@ class TestChatPipelineComprehensive:
             assert len(events) >= 1
             assert "[DONE]" in events[-1]
 
-    @pytest.mark.asyncio
     async def test_user_facts(self, client):
         ac, headers = client
         fact = "User is a Python Developer."
+        f = UserFact(
+            id=str(uuid.uuid4()),
+            tenant_id=self.tenant_id,
+            user_id=self.user_id,
+            content=fact,
+            importance=1.0,
+        )
+
         async_session = get_session_maker()
         async with async_session() as session:
-            f = UserFact(
-                id=str(uuid.uuid4()),
-                tenant_id=self.tenant_id,
-                user_id=self.user_id,
-                content=fact,
-                importance=1.0,
+            ((d_dummy, c_dummy, _),) = await self._seed_many(
+                session, objects=[f], items=[("Generic", "seed.txt")]
             )
-            session.add(f)
             await session.commit()
 
-        d_dummy, c_dummy, _ = await self._seed_document_and_chunk("Generic")
         self.mock_vector_store.search.return_value = [
-            SearchResult(
-                chunk_id=c_dummy,
-                document_id=d_dummy,
-                tenant_id=self.tenant_id,
-                score=0.5,
-                metadata={"content": "Generic content."},
-            )
+            self._make_result(c_dummy, d_dummy, "Generic content.", score=0.5)
         ]
 
         await ac.post(
@@ -514,31 +567,26 @@ class TestChatPipelineComprehensive:
         call_args = str(self.mock_llm.generate.call_args)
         assert "Python Developer" in call_args
 
-    @pytest.mark.asyncio
     async def test_conversation_summaries(self, client):
         ac, headers = client
         summary = "User likes Star Wars."
+        s = ConversationSummary(
+            id=str(uuid.uuid4()),
+            tenant_id=self.tenant_id,
+            user_id=self.user_id,
+            title="Movie Chat",
+            summary=summary,
+        )
+
         async_session = get_session_maker()
         async with async_session() as session:
-            s = ConversationSummary(
-                id=str(uuid.uuid4()),
-                tenant_id=self.tenant_id,
-                user_id=self.user_id,
-                title="Movie Chat",
-                summary=summary,
+            ((d_dummy, c_dummy, _),) = await self._seed_many(
+                session, objects=[s], items=[("Generic", "seed.txt")]
             )
-            session.add(s)
             await session.commit()
 
-        d_dummy, c_dummy, _ = await self._seed_document_and_chunk("Generic")
         self.mock_vector_store.search.return_value = [
-            SearchResult(
-                chunk_id=c_dummy,
-                document_id=d_dummy,
-                tenant_id=self.tenant_id,
-                score=0.5,
-                metadata={"content": "Generic context."},
-            )
+            self._make_result(c_dummy, d_dummy, "Generic context.", score=0.5)
         ]
 
         await ac.post(
@@ -5,13 +5,20 @@ Integration Tests for Export API Endpoints
 Tests for conversation export functionality including single and bulk exports.
 """
 
+import os
+
 import pytest
 
 # NOTE: client and api_key fixtures come from conftest.py
 # The conftest.py api_key fixture properly registers the key in the database
 
 
-@pytest.mark.asyncio
+@pytest.fixture(scope="module")
+def openapi_paths(openapi_dict):
+    """Paths section of the session-wide OpenAPI schema."""
+    return openapi_dict.get("paths", {})
+
+
 class TestSingleConversationExport:
     """Tests for single conversation export endpoint."""
 
@@ -29,7 +36,6 @@ class TestSingleConversationExport:
         assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 class TestBulkExport:
     """Tests for bulk export endpoints."""
 
@@ -66,43 +72,30 @@ class TestBulkExport:
         assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 class TestExportEndpointRegistration:
     """Tests that export endpoints are properly registered."""
 
-    async def test_export_routes_in_openapi(self, client):
-        """Export routes should be in OpenAPI schema."""
+    @pytest.mark.skipif(os.getenv("FAST") == "1", reason="HTTP smoke check skipped in FAST mode")
+    async def test_openapi_endpoint_serves_schema(self, client):
+        """The /openapi.json route should respond."""
         response = await client.get("/openapi.json")
         assert response.status_code == 200
 
-        data = response.json()
-        paths = data.get("paths", {})
-
+    async def test_export_routes_in_openapi(self, openapi_paths):
+        """Export routes should be in OpenAPI schema."""
         # Check export endpoints are registered
-        export_paths = [p for p in paths.keys() if "/export" in p]
+        export_paths = [p for p in openapi_paths.keys() if "/export" in p]
         assert len(export_paths) > 0, "Export routes should be registered"
 
-    async def test_single_export_endpoint_exists(self, client):
+    async def test_single_export_endpoint_exists(self, openapi_paths):
         """Single conversation export endpoint should exist."""
-        response = await client.get("/openapi.json")
-        data = response.json()
-        paths = data.get("paths", {})
-
         # Check specific endpoint pattern exists
-        assert any("/export/conversation/" in p for p in paths.keys())
+        assert any("/export/conversation/" in p for p in openapi_paths.keys())
 
-    async def test_bulk_export_endpoint_exists(self, client):
+    async def test_bulk_export_endpoint_exists(self, openapi_paths):
         """Bulk export endpoint should exist."""
-        response = await client.get("/openapi.json")
-        data = response.json()
-        paths = data.get("paths", {})
+        assert "/v1/export/all" in openapi_paths
 
-        assert "/v1/export/all" in paths
-
-    async def test_job_status_endpoint_exists(self, client):
+    async def test_job_status_endpoint_exists(self, openapi_paths):
         """Job status endpoint should exist."""
-        response = await client.get("/openapi.json")
-        data = response.json()
-        paths = data.get("paths", {})
-
-        assert any("/export/job/{job_id}" in p for p in paths.keys())
+        assert any("/export/job/{job_id}" in p for p in openapi_paths.keys())
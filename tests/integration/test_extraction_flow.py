@@ -39,6 +39,12 @@ async def test_extractor_registry():
     extractor = ExtractorRegistry.get_extractor("application/octet-stream")
     assert isinstance(extractor, BaseExtractor)
 
+    # 4. Instances are cached per extractor, so repeat lookups reuse them
+    for mime_type in ("application/pdf", "text/plain", "application/octet-stream"):
+        assert ExtractorRegistry.get_extractor(mime_type) is ExtractorRegistry.get_extractor(
+            mime_type
+        )
+
 
 @pytest.mark.asyncio
 async def test_unstructured_extractor_basic():
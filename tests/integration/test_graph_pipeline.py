@@ -1,3 +1,4 @@
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -10,6 +11,53 @@ from src.core.generation.application.prompts.entity_extraction import (
 from src.core.graph.application.writer import graph_writer
 from src.core.graph.domain.ports.graph_client import set_graph_client
 
+# Validated once at import; the writer only reads it
+_EXTRACTION_RESULT = ExtractionResult(
+    entities=[
+        ExtractedEntity(name="Neo4j", type="TECHNOLOGY", description="Graph Database"),
+        ExtractedEntity(name="Python", type="TECHNOLOGY", description="Programming Language"),
+    ],
+    relationships=[
+        ExtractedRelationship(
+            source="Python",
+            target="Neo4j",
+            type="CONNECTS_TO",
+            description="Python driver connects to Neo4j",
+            weight=9,
+        )
+    ],
+)
+
+
+class FakeGraphClient:
+    """
+    In-process GraphClientPort that records writes instead of sending them.
+
+    Plain lists keep the test free of Bolt round-trips and AsyncMock call
+    bookkeeping; reads return no rows.
+    """
+
+    def __init__(self):
+        self.writes: list[tuple[str, dict[str, Any] | None]] = []
+        self.batches: list[list[tuple[str, dict[str, Any] | None]]] = []
+
+    async def connect(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def execute_read(self, query, parameters=None) -> list[dict[str, Any]]:
+        return []
+
+    async def execute_write(self, query, parameters=None) -> list[dict[str, Any]]:
+        self.writes.append((query, parameters))
+        return []
+
+    async def execute_write_batch(self, statements) -> list[list[dict[str, Any]]]:
+        self.batches.append(list(statements))
+        return [[] for _ in statements]
+
 
 @pytest.mark.asyncio
 async def test_graph_writer_pipeline_with_injected_graph_client():
@@ -23,25 +71,7 @@ async def test_graph_writer_pipeline_with_injected_graph_client():
     doc_id = "doc_integration_1"
     chunk_id = "chunk_integration_1"
 
-    extraction_result = ExtractionResult(
-        entities=[
-            ExtractedEntity(name="Neo4j", type="TECHNOLOGY", description="Graph Database"),
-            ExtractedEntity(name="Python", type="TECHNOLOGY", description="Programming Language"),
-        ],
-        relationships=[
-            ExtractedRelationship(
-                source="Python",
-                target="Neo4j",
-                type="CONNECTS_TO",
-                description="Python driver connects to Neo4j",
-                weight=9,
-            )
-        ],
-    )
-
-    fake_graph_client = AsyncMock()
-    fake_graph_client.execute_write = AsyncMock(return_value=[])
-    fake_graph_client.execute_write_batch = AsyncMock(return_value=[])
+    fake_graph_client = FakeGraphClient()
     set_graph_client(fake_graph_client)
 
     with patch(
@@ -50,10 +80,11 @@ async def test_graph_writer_pipeline_with_injected_graph_client():
         lifecycle = AsyncMock()
         mock_lifecycle_cls.return_value = lifecycle
 
-        await graph_writer.write_extraction_result(doc_id, chunk_id, tenant_id, extraction_result)
+        await graph_writer.write_extraction_result(doc_id, chunk_id, tenant_id, _EXTRACTION_RESULT)
 
-    fake_graph_client.execute_write_batch.assert_awaited_once()
-    statements = fake_graph_client.execute_write_batch.await_args.args[0]
+    assert len(fake_graph_client.batches) == 1
+    assert fake_graph_client.writes == []
+    statements = fake_graph_client.batches[0]
     assert len(statements) == 2  # base query + one relationship type query
     lifecycle.mark_stale_by_entities_by_name.assert_awaited_once_with(
         ["Neo4j", "Python"], tenant_id
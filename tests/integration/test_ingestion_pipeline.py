@@ -21,7 +21,7 @@ import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 
-from src.amber_platform.composition_root import build_session_factory, platform
+from src.amber_platform.composition_root import build_session_factory
 from src.api.config import settings
 from src.api.main import app
 from src.core.retrieval.infrastructure.vector_store.milvus import MilvusConfig, MilvusVectorStore
@@ -162,7 +162,11 @@ class TestIngestionPipeline:
 
     @pytest.mark.asyncio
     async def test_complete_pipeline(
-        self, client: AsyncClient, api_key: str, test_pdf_file: tuple[str, bytes, str]
+        self,
+        client: AsyncClient,
+        api_key: str,
+        test_pdf_file: tuple[str, bytes, str],
+        neo4j,
     ):
         """
         Test the complete ingestion pipeline from upload to graph sync.
@@ -279,37 +283,32 @@ class TestIngestionPipeline:
 
         # Step 6: Verify Neo4j graph structure
         print("6. Verifying Neo4j graph...")
-        # Ensure we use the platform client which is managed (or not? Test creates its own mostly for connection control?)
-        # platform.neo4j_client might not be initialized if we didn't call platform.initialize().
-        # api.main calls platform.initialize() on startup.
-        # But we are using AsyncClient with ASGITransport(app=app).
-        # We need to make sure startup event ran.
-        # But for direct verification in test code, we can access platform.neo4j_client.
-        # Wait, if app is not running via Uvicorn, startup events might run via TestClient?
-        # httpx AsyncClient blocks startup?
-        # If not, we should manually initialize platform or assume app did it.
-        # Let's assume app did it or we do it.
-
-        # Accessing platform.neo4j_client property will lazy init if not explicit.
-        neo4j_client = platform.neo4j_client
-        await neo4j_client.connect()
+        # The neo4j fixture hands over an already-connected client
+        neo4j_client = neo4j
 
         try:
-            # Check document node
-            doc_query = """
-            MATCH (d:Document {id: $doc_id})
-            RETURN count(d) as count
+            # Document, chunk and entity counts in one round-trip
+            counts_query = """
+            CALL {
+                MATCH (d:Document {id: $doc_id})
+                RETURN count(d) AS docs
+            }
+            CALL {
+                MATCH (d:Document {id: $doc_id})-[:HAS_CHUNK]->(c:Chunk)
+                RETURN count(c) AS chunks
+            }
+            CALL {
+                MATCH (c:Chunk {document_id: $doc_id})-[:MENTIONS]->(e:Entity)
+                RETURN count(DISTINCT e) AS entities
+            }
+            RETURN docs, chunks, entities
             """
-            result = await neo4j_client.execute_read(doc_query, {"doc_id": document_id})
-            assert result[0]["count"] == 1, "Document not in Neo4j"
+            result = await neo4j_client.execute_read(counts_query, {"doc_id": document_id})
+            counts = result[0]
 
-            # Check chunks
-            chunk_query = """
-            MATCH (d:Document {id: $doc_id})-[:HAS_CHUNK]->(c:Chunk)
-            RETURN count(c) as count
-            """
-            result = await neo4j_client.execute_read(chunk_query, {"doc_id": document_id})
-            neo4j_chunks = result[0]["count"]
+            assert counts["docs"] == 1, "Document not in Neo4j"
+
+            neo4j_chunks = counts["chunks"]
             # Filter chunks that are expected to be processed (>= 50 chars)
             # GraphProcessor skips chunks shorter than 50 characters
             expected_neo4j_count = sum(1 for c in chunks if len(c["content"]) >= 50)
@@ -317,13 +316,7 @@ class TestIngestionPipeline:
                 f"Chunk mismatch: {neo4j_chunks} vs {expected_neo4j_count} (Total chunks: {len(chunks)})"
             )
 
-            # Check entities
-            entity_query = """
-            MATCH (c:Chunk {document_id: $doc_id})-[:MENTIONS]->(e:Entity)
-            RETURN count(DISTINCT e) as count
-            """
-            result = await neo4j_client.execute_read(entity_query, {"doc_id": document_id})
-            neo4j_entities = result[0]["count"]
+            neo4j_entities = counts["entities"]
             assert neo4j_entities == len(entities), (
                 f"Entity mismatch: {neo4j_entities} vs {len(entities)}"
             )
@@ -371,10 +364,6 @@ class TestIngestionPipeline:
         MATCH (c1:Chunk {document_id: $doc_id})-[r:SIMILAR_TO]->(c2:Chunk)
         RETURN count(r) as count
         """
-        # We need to reconnect or use existing connection?
-        # The previous block closed it?
-        # Block 6 closed it in `finally`.
-        await neo4j_client.connect()
         try:
             result = await neo4j_client.execute_read(similarity_query, {"doc_id": document_id})
             similarity_count = result[0]["count"]
@@ -395,7 +384,6 @@ class TestIngestionPipeline:
         found_communities = False
         tenant_id = doc_data["tenant_id"]
 
-        await neo4j_client.connect()
         try:
             for i in range(30):  # Wait up to 30 seconds
                 comm_query = """
@@ -5,35 +5,41 @@ Worker Orchestration Integration Test
 Verifies the Celery task and API integration.
 """
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
-from src.workers.tasks import _publish_status, process_document
+from src.workers.tasks import _build_status_payload, _publish_status
+
+
+def _redis_capture():
+    """Stand-in Redis client that records published (channel, message) pairs."""
+    published: list[tuple[str, str]] = []
+    client = SimpleNamespace(
+        publish=lambda channel, message: published.append((channel, message)),
+        close=lambda: None,
+    )
+    return client, published
 
 
 def test_publish_status():
     """Test status publishing to Redis."""
-    with patch("redis.Redis") as mock_redis_class:
-        mock_client = MagicMock()
-        mock_redis_class.from_url.return_value = mock_client
-
+    client, published = _redis_capture()
+    with patch("redis.Redis.from_url", new=lambda url: client):
         _publish_status("doc123", "EXTRACTING", 25)
 
-        mock_redis_class.from_url.assert_called_once()
-        mock_client.publish.assert_called_once()
+    assert len(published) == 1
 
 
-def test_celery_task_registered():
+def test_celery_task_registered(celery):
     """Verify process_document task is properly registered."""
-    from src.workers.celery_app import celery_app
-
-    tasks = celery_app.tasks
+    tasks = celery.tasks
     assert "src.workers.tasks.process_document" in tasks
     assert "src.workers.tasks.health_check" in tasks
 
 
-def test_retry_configuration():
+def test_retry_configuration(celery):
     """Verify retry configuration is set correctly."""
-    task = process_document
+    task = celery.tasks["src.workers.tasks.process_document"]
     assert task.max_retries == 3
     assert task.default_retry_delay == 60
 
@@ -42,16 +48,24 @@ def test_publish_status_with_error():
     """Test status publishing includes error when provided."""
     import json
 
-    with patch("redis.Redis") as mock_redis_class:
-        mock_client = MagicMock()
-        mock_redis_class.from_url.return_value = mock_client
-
+    client, published = _redis_capture()
+    with patch("redis.Redis.from_url", new=lambda url: client):
         _publish_status("doc123", "FAILED", 100, error="Test error")
 
-        call_args = mock_client.publish.call_args
-        channel = call_args[0][0]
-        message = json.loads(call_args[0][1])
+    channel, raw = published[0]
+    message = json.loads(raw)
+
+    assert "doc123" in channel
+    assert message["status"] == "FAILED"
+    assert message["error"] == "Test error"
+
 
-        assert "doc123" in channel
-        assert message["status"] == "FAILED"
-        assert message["error"] == "Test error"
+def test_build_status_payload_with_error():
+    """Status payload includes the error only when one is given."""
+    assert _build_status_payload("doc123", "FAILED", 100, error="Test error") == {
+        "document_id": "doc123",
+        "status": "FAILED",
+        "progress": 100,
+        "error": "Test error",
+    }
+    assert "error" not in _build_status_payload("doc123", "EXTRACTING", 25)
@@ -0,0 +1,29 @@
+"""
+Unit Test Fixtures
+==================
+
+Fixtures shared by the unit test modules.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.shared.kernel.runtime import _reset_for_tests, configure_settings
+from src.shared.model_registry import DEFAULT_LLM_MODEL
+
+
+class DummySettings:
+    default_llm_provider = "openai"
+    default_llm_model = DEFAULT_LLM_MODEL["openai"]
+    default_llm_temperature = 0.0
+    seed = 42
+    db = SimpleNamespace(redis_url="redis://test")
+
+
+@pytest.fixture
+def configure_runtime_settings():
+    """Install DummySettings as the runtime settings for one test."""
+    configure_settings(DummySettings())
+    yield
+    _reset_for_tests()
@@ -1,14 +1,50 @@
+import os
+import re
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Compiled once and shared by every file; extend the alternation to forbid
+# further imports in the same pass
+_FORBIDDEN = re.compile(rb"amber_platform")
+
+
+def _mentions_platform(path: Path) -> bool:
+    # Match on raw bytes; no need to decode the file first
+    return _FORBIDDEN.search(path.read_bytes()) is not None
+
+
+def _iter_py_files(root: Path):
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune in place so os.walk never descends into bytecode caches
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for name in filenames:
+            if name.endswith(".py"):
+                yield Path(dirpath, name)
+
+
+def _find_platform_imports(core_root: Path) -> list[str]:
+    """List files under core_root mentioning amber_platform, via ripgrep when available."""
+    rg = shutil.which("rg")
+    if rg:
+        proc = subprocess.run(
+            # -uu: include ignored and hidden files, like the os.walk fallback
+            [rg, "-l", "-uu", "--type=py", _FORBIDDEN.pattern.decode(), str(core_root)],
+            capture_output=True,
+            text=True,
+        )
+        # ripgrep exits 1 when nothing matches
+        assert proc.returncode in (0, 1), proc.stderr
+        return sorted(proc.stdout.splitlines())
+
+    paths = list(_iter_py_files(core_root))
+    with ThreadPoolExecutor() as pool:
+        hits = pool.map(_mentions_platform, paths)
+        return sorted(str(path) for path, hit in zip(paths, hits, strict=True) if hit)
+
 
 def test_no_amber_platform_imports_in_core():
-    core_root = Path("src/core")
-    offenders = []
-    for path in core_root.rglob("*.py"):
-        if "__pycache__" in str(path):
-            continue
-        content = path.read_text(encoding="utf-8")
-        if "amber_platform" in content:
-            offenders.append(str(path))
+    offenders = _find_platform_imports(Path("src/core"))
 
     assert offenders == [], f"core imports amber_platform: {offenders}"
@@ -20,6 +20,11 @@ def mock_factory():
     return factory
 
 
+@pytest.fixture
+def summarizer(mock_neo4j, mock_factory):
+    return CommunitySummarizer(mock_neo4j, mock_factory)
+
+
 @pytest.fixture
 def mock_embedding_service():
     service = AsyncMock()
@@ -29,10 +34,7 @@ def mock_embedding_service():
 
 class TestCommunitySummarizer:
     @pytest.mark.asyncio
-    async def test_summarize_community_success(self, mock_neo4j, mock_factory):
-        # Setup
-        summarizer = CommunitySummarizer(mock_neo4j, mock_factory)
-
+    async def test_summarize_community_success(self, summarizer, mock_neo4j, mock_factory):
         # Mock data fetch
         mock_neo4j.execute_read.side_effect = [
             [{"name": "Entity A", "type": "Person", "description": "Desc A"}],  # entities
@@ -71,8 +73,7 @@ class TestCommunitySummarizer:
         assert "SET c.title = $title" in mock_neo4j.execute_write.call_args[0][0]
 
     @pytest.mark.asyncio
-    async def test_summarize_community_no_data(self, mock_neo4j, mock_factory):
-        summarizer = CommunitySummarizer(mock_neo4j, mock_factory)
+    async def test_summarize_community_no_data(self, summarizer, mock_neo4j):
         mock_neo4j.execute_read.return_value = []
 
         with patch("src.shared.kernel.runtime.get_settings"):
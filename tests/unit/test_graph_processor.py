@@ -28,7 +28,7 @@ async def test_processor_flow():
         )
         mock_extractor.extract = AsyncMock(return_value=mock_result_with_entities)
 
-        mock_writer.write_extraction_result = AsyncMock()
+        mock_writer.write_extraction_results_bulk = AsyncMock()
 
         chunks = [
             _chunk(
@@ -48,27 +48,30 @@ async def test_processor_flow():
         await processor.process_chunks(chunks, "tenant_1")
 
         assert mock_extractor.extract.call_count == 2
-        assert mock_writer.write_extraction_result.call_count == 2
+        mock_writer.write_extraction_results_bulk.assert_awaited_once()
+        kwargs = mock_writer.write_extraction_results_bulk.await_args.kwargs
+        assert kwargs["document_id"] == "d1"
+        assert sorted(chunk_id for chunk_id, _ in kwargs["items"]) == ["c1", "c2"]
 
 
 @pytest.mark.asyncio
-async def test_write_happens_outside_llm_semaphore():
-    extract_start: dict[str, float] = {}
-    write_window: dict[str, tuple[float, float]] = {}
+async def test_write_happens_after_all_extractions():
+    extract_end: dict[str, float] = {}
+    write_starts: list[float] = []
+    events: list[object] = []
 
     async def _extract(text, chunk_id=None, **kwargs):
-        extract_start[chunk_id] = time.perf_counter()
         await asyncio.sleep(0.01)
+        extract_end[chunk_id] = time.perf_counter()
         return ExtractionResult(
             entities=[ExtractedEntity(name="E1", type="CONCEPT", description="D1")],
             relationships=[],
             usage=ExtractionUsage(total_tokens=1, llm_calls=1),
         )
 
-    async def _write(document_id, chunk_id, tenant_id, result, filename=None):
-        start = time.perf_counter()
-        await asyncio.sleep(0.08 if chunk_id == "c1" else 0.01)
-        write_window[chunk_id] = (start, time.perf_counter())
+    async def _write(document_id, tenant_id, items, filename=None):
+        write_starts.append(time.perf_counter())
+        events.append("write")
 
     chunks = [
         _chunk("c1", "d1", "Chunk 1 is long enough to be processed by graph pipeline code path."),
@@ -84,20 +87,88 @@ async def test_write_happens_outside_llm_semaphore():
             "src.core.graph.application.processor.resolve_graph_sync_runtime_config"
         ) as mock_resolve,
     ):
-        mock_writer.write_extraction_result = AsyncMock(side_effect=_write)
+        mock_writer.write_extraction_results_bulk = AsyncMock(side_effect=_write)
         mock_resolve.return_value.initial_concurrency = 1
         mock_resolve.return_value.max_concurrency = 2
         mock_resolve.return_value.adaptive_concurrency_enabled = False
         mock_resolve.return_value.profile = "local_weak"
 
+        processor = GraphProcessor(graph_extractor=mock_extractor)
+        await processor.process_chunks(
+            chunks,
+            "tenant_1",
+            progress_callback=lambda completed, total: events.append((completed, total)),
+        )
+
+    # Below the batch size: one write, issued once every extraction has finished
+    assert len(write_starts) == 1
+    assert max(extract_end.values()) <= write_starts[0]
+    # Full progress is only reported once the write is done
+    assert events == [(1, 2), "write", (2, 2)]
+
+
+@pytest.mark.asyncio
+async def test_write_failure_counts_chunk_errors(caplog):
+    caplog.set_level(logging.INFO)
+
+    mock_result = ExtractionResult(
+        entities=[ExtractedEntity(name="E1", type="CONCEPT", description="D1")],
+        relationships=[],
+        usage=ExtractionUsage(total_tokens=1, llm_calls=1),
+    )
+
+    chunks = [
+        _chunk("c1", "d1", "Chunk 1 is long enough to be processed by graph pipeline code path."),
+        _chunk("c2", "d1", "Chunk 2 is long enough to be processed by graph pipeline code path."),
+    ]
+
+    with patch("src.core.graph.application.processor.graph_writer") as mock_writer:
+        mock_writer.write_extraction_results_bulk = AsyncMock(side_effect=RuntimeError("down"))
+        mock_extractor = AsyncMock()
+        mock_extractor.extract = AsyncMock(return_value=mock_result)
+
         processor = GraphProcessor(graph_extractor=mock_extractor)
         await processor.process_chunks(chunks, "tenant_1")
 
-    assert "c1" in write_window
-    assert "c2" in extract_start
-    c1_write_end = write_window["c1"][1]
-    c2_extract_start = extract_start["c2"]
-    assert c2_extract_start < c1_write_end
+    messages = [record.getMessage() for record in caplog.records]
+    assert any('"chunk_errors": 2' in m for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_writes_are_flushed_in_bounded_batches(caplog):
+    caplog.set_level(logging.INFO)
+
+    mock_result = ExtractionResult(
+        entities=[ExtractedEntity(name="E1", type="CONCEPT", description="D1")],
+        relationships=[],
+        usage=ExtractionUsage(total_tokens=1, llm_calls=1),
+    )
+    batch_sizes: list[int] = []
+
+    async def _write(document_id, tenant_id, items, filename=None):
+        batch_sizes.append(len(items))
+        # Only the first full batch fails
+        if len(batch_sizes) == 1:
+            raise RuntimeError("down")
+
+    chunks = [
+        _chunk(f"c{i}", "d1", f"Chunk {i} is long enough to be processed by graph pipeline code.")
+        for i in range(5)
+    ]
+
+    with patch("src.core.graph.application.processor.graph_writer") as mock_writer:
+        mock_writer.write_extraction_results_bulk = AsyncMock(side_effect=_write)
+        mock_extractor = AsyncMock()
+        mock_extractor.extract = AsyncMock(return_value=mock_result)
+
+        processor = GraphProcessor(graph_extractor=mock_extractor)
+        processor.WRITE_BATCH_SIZE = 2
+        await processor.process_chunks(chunks, "tenant_1")
+
+    # Two full batches during extraction, then the remainder
+    assert batch_sizes == [2, 2, 1]
+    messages = [record.getMessage() for record in caplog.records]
+    assert any('"chunk_errors": 2' in m for m in messages)
 
 
 @pytest.mark.asyncio
@@ -117,7 +188,7 @@ async def test_processor_emits_chunk_and_document_metrics(caplog):
     )
 
     with patch("src.core.graph.application.processor.graph_writer") as mock_writer:
-        mock_writer.write_extraction_result = AsyncMock()
+        mock_writer.write_extraction_results_bulk = AsyncMock()
         mock_extractor = AsyncMock()
         mock_extractor.extract = AsyncMock(return_value=mock_result)
 
@@ -143,7 +214,7 @@ async def test_processor_passes_chunk_progress_to_extractor():
     ]
 
     with patch("src.core.graph.application.processor.graph_writer") as mock_writer:
-        mock_writer.write_extraction_result = AsyncMock()
+        mock_writer.write_extraction_results_bulk = AsyncMock()
         mock_extractor = AsyncMock()
         mock_extractor.extract = AsyncMock(return_value=mock_result)
 
@@ -183,7 +254,7 @@ async def test_processor_supports_adaptive_concurrency_mode(caplog):
             "src.core.graph.application.processor.resolve_graph_sync_runtime_config"
         ) as mock_resolve,
     ):
-        mock_writer.write_extraction_result = AsyncMock()
+        mock_writer.write_extraction_results_bulk = AsyncMock()
         mock_extractor = AsyncMock()
         mock_extractor.extract = AsyncMock(return_value=mock_result)
 
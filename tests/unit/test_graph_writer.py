@@ -99,3 +99,45 @@ async def test_writer_falls_back_to_execute_write_without_batch_support():
     # 1 base query + 2 relationship-type queries
     assert fake_graph_client.execute_write.await_count == 3
     lifecycle.mark_stale_by_entities_by_name.assert_awaited_once_with(["A", "B"], "tenant1")
+
+
+@pytest.mark.asyncio
+async def test_bulk_writer_sends_one_batch_for_all_chunks():
+    writer = GraphWriter()
+    fake_graph_client = SimpleNamespace(
+        execute_write=AsyncMock(),
+        execute_write_batch=AsyncMock(),
+    )
+
+    with (
+        patch(
+            "src.core.graph.application.writer.get_graph_client",
+            return_value=fake_graph_client,
+        ),
+        patch(
+            "src.core.graph.application.communities.lifecycle.CommunityLifecycleManager"
+        ) as mock_lifecycle_cls,
+    ):
+        lifecycle = AsyncMock()
+        mock_lifecycle_cls.return_value = lifecycle
+
+        await writer.write_extraction_results_bulk(
+            document_id="doc1",
+            tenant_id="tenant1",
+            items=[
+                ("chunk1", _build_result()),
+                ("chunk2", _build_result()),
+                ("chunk3", ExtractionResult(entities=[], relationships=[])),
+            ],
+            filename="f.txt",
+        )
+
+    fake_graph_client.execute_write_batch.assert_awaited_once()
+    fake_graph_client.execute_write.assert_not_called()
+    statements = fake_graph_client.execute_write_batch.await_args.args[0]
+    # 1 base query for both chunks + 2 relationship-type queries
+    assert len(statements) == 3
+    base_params = statements[0][1]
+    assert [c["chunk_id"] for c in base_params["chunks"]] == ["chunk1", "chunk2"]
+    assert [len(params["batch"]) for _, params in statements[1:]] == [2, 2]
+    lifecycle.mark_stale_by_entities_by_name.assert_awaited_once_with(["A", "B"], "tenant1")
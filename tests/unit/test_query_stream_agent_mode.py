@@ -1,3 +1,4 @@
+import re
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -8,6 +9,9 @@ from src.api.routes.query import _query_stream_impl
 from src.api.schemas.query import QueryRequest
 from src.shared.kernel.models.query import QueryOptions
 
+# SSE event names, collected in one pass over the streamed payload
+_EVENT_RE = re.compile(rb"^event:\s*(\w+)", re.MULTILINE)
+
 
 class StubConversationSummary:
     def __init__(self, **kwargs):
@@ -50,74 +54,90 @@ class StubAgentOrchestrator:
         )
 
 
+_BASE_SCOPE = {
+    "type": "http",
+    "method": "POST",
+    "path": "/query/stream",
+    "raw_path": b"/query/stream",
+    "query_string": b"",
+    "headers": [],
+    "client": ("testclient", 50000),
+    "server": ("testserver", 80),
+    "scheme": "http",
+    "http_version": "1.1",
+}
+
+
 def _build_post_request() -> Request:
-    scope = {
-        "type": "http",
-        "method": "POST",
-        "path": "/query/stream",
-        "raw_path": b"/query/stream",
-        "query_string": b"",
-        "headers": [],
-        "client": ("testclient", 50000),
-        "server": ("testserver", 80),
-        "scheme": "http",
-        "http_version": "1.1",
-    }
-    request = Request(scope)
+    # Shallow copy: request.state writes into the scope, the shared values are immutable
+    request = Request(dict(_BASE_SCOPE))
     request.state.tenant_id = "tenant-test"
     return request
 
 
-@pytest.mark.asyncio
-async def test_query_stream_agent_mode_emits_done(monkeypatch):
-    async def _dummy_tool(*_args, **_kwargs):
-        return {"ok": True}
+async def _dummy_tool(*_args, **_kwargs):
+    return {"ok": True}
+
 
-    def _create_retrieval_tool(_retrieval_service, _tenant_id):
-        return {
-            "name": "retrieve_context",
+def _create_retrieval_tool(_retrieval_service, _tenant_id):
+    return {
+        "name": "retrieve_context",
+        "func": _dummy_tool,
+        "schema": {"name": "retrieve_context"},
+    }
+
+
+def _create_filesystem_tools(*_args, **_kwargs):
+    return [
+        {
+            "name": "list_files",
             "func": _dummy_tool,
-            "schema": {"name": "retrieve_context"},
+            "schema": {"name": "list_files"},
         }
+    ]
+
+
+# Nothing asserts against these, so one instance serves every call
+_RETRIEVAL_SERVICE = MagicMock()
+_GENERATION_SERVICE = MagicMock()
+_SESSION = MagicMock()
+
+
+@pytest.fixture(scope="module")
+def agent_stubs():
+    """
+    Replace the agent-mode collaborators of the query stream for the module.
+
+    The target modules are imported once here and patched by attribute, so
+    the dotted paths are not re-resolved for every test.
+    """
+    from src.amber_platform import composition_root
+    from src.api import deps
+    from src.core.generation.application.agent import orchestrator
+    from src.core.generation.domain import memory_models
+    from src.core.tools import filesystem, retrieval
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            composition_root,
+            "build_retrieval_service",
+            lambda _session: _RETRIEVAL_SERVICE,
+        )
+        mp.setattr(
+            composition_root,
+            "build_generation_service",
+            lambda _session: _GENERATION_SERVICE,
+        )
+        mp.setattr(orchestrator, "AgentOrchestrator", StubAgentOrchestrator)
+        mp.setattr(retrieval, "create_retrieval_tool", _create_retrieval_tool)
+        mp.setattr(filesystem, "create_filesystem_tools", _create_filesystem_tools)
+        mp.setattr(deps, "_get_async_session_maker", lambda: StubSessionMaker())
+        mp.setattr(memory_models, "ConversationSummary", StubConversationSummary)
+        yield
 
-    def _create_filesystem_tools(*_args, **_kwargs):
-        return [
-            {
-                "name": "list_files",
-                "func": _dummy_tool,
-                "schema": {"name": "list_files"},
-            }
-        ]
-
-    monkeypatch.setattr(
-        "src.amber_platform.composition_root.build_retrieval_service",
-        lambda _session: MagicMock(),
-    )
-    monkeypatch.setattr(
-        "src.amber_platform.composition_root.build_generation_service",
-        lambda _session: MagicMock(),
-    )
-    monkeypatch.setattr(
-        "src.core.generation.application.agent.orchestrator.AgentOrchestrator",
-        StubAgentOrchestrator,
-    )
-    monkeypatch.setattr(
-        "src.core.tools.retrieval.create_retrieval_tool",
-        _create_retrieval_tool,
-    )
-    monkeypatch.setattr(
-        "src.core.tools.filesystem.create_filesystem_tools",
-        _create_filesystem_tools,
-    )
-    monkeypatch.setattr(
-        "src.api.deps._get_async_session_maker",
-        lambda: StubSessionMaker(),
-    )
-    monkeypatch.setattr(
-        "src.core.generation.domain.memory_models.ConversationSummary",
-        StubConversationSummary,
-    )
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_query_stream_agent_mode_emits_done(agent_stubs):
     request = QueryRequest(
         query="Summarize workspace",
         options=QueryOptions(agent_mode=True, agent_role="maintainer"),
@@ -126,15 +146,14 @@ async def test_query_stream_agent_mode_emits_done(monkeypatch):
     response = await _query_stream_impl(
         http_request=_build_post_request(),
         request=request,
-        session=MagicMock(),
+        session=_SESSION,
     )
 
-    payload_parts: list[str] = []
+    payload = bytearray()
     async for chunk in response.body_iterator:
-        payload_parts.append(chunk.decode() if isinstance(chunk, bytes) else chunk)
+        payload.extend(chunk if isinstance(chunk, bytes) else chunk.encode())
 
-    payload = "".join(payload_parts)
-    assert "event: conversation_id" in payload
-    assert "event: done" in payload
-    assert "Agent answer" in payload
-    assert "event: processing_error" not in payload
+    events = {match.group(1) for match in _EVENT_RE.finditer(payload)}
+    assert {b"conversation_id", b"done"} <= events
+    assert b"processing_error" not in events
+    assert b"Agent answer" in payload
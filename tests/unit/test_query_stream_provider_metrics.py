@@ -1,25 +1,8 @@
-from types import SimpleNamespace
-
 import pytest
 
 from src.core.generation.application.generation_service import GenerationConfig, GenerationService
-from src.shared.kernel.runtime import _reset_for_tests, configure_settings
-from src.shared.model_registry import DEFAULT_LLM_MODEL
-
-
-class DummySettings:
-    default_llm_provider = "openai"
-    default_llm_model = DEFAULT_LLM_MODEL["openai"]
-    default_llm_temperature = 0.0
-    seed = 42
-    db = SimpleNamespace(redis_url="redis://test")
-
 
-@pytest.fixture(autouse=True)
-def configure_runtime_settings():
-    configure_settings(DummySettings())
-    yield
-    _reset_for_tests()
+pytestmark = pytest.mark.usefixtures("configure_runtime_settings")
 
 
 class DummyProvider:
@@ -30,7 +13,7 @@ class DummyProvider:
         yield "Hello"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stream_done_includes_provider():
     service = GenerationService(
         llm_provider=DummyProvider(),
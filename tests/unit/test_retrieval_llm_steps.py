@@ -1,8 +1,5 @@
-from types import SimpleNamespace
-
 import pytest
 
-from src.shared.kernel.runtime import _reset_for_tests, configure_settings
 from src.shared.model_registry import DEFAULT_LLM_MODEL, LLM_MODELS
 
 
@@ -17,20 +14,10 @@ OPENAI_DEFAULT = DEFAULT_LLM_MODEL["openai"]
 OPENAI_ALT = _first_other(LLM_MODELS["openai"], OPENAI_DEFAULT)
 
 
-class DummySettings:
-    default_llm_provider = "openai"
-    default_llm_model = OPENAI_DEFAULT
-    default_llm_temperature = 0.0
-    seed = 42
-    db = SimpleNamespace(redis_url="redis://test")
-
-
-@pytest.mark.asyncio
-async def test_rewrite_step_resolves_custom_seed():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_rewrite_step_resolves_custom_seed(configure_runtime_settings):
     from src.core.retrieval.application.query.rewriter import QueryRewriter
 
-    configure_settings(DummySettings())
-
     class DummyProvider:
         def __init__(self):
             self.calls = []
@@ -61,11 +48,8 @@ async def test_rewrite_step_resolves_custom_seed():
         }
     }
 
-    try:
-        result = await rewriter.rewrite("hello", history="context", tenant_config=tenant_config)
-        assert result == "rewritten"
-        assert provider.calls
-        assert provider.calls[0]["temperature"] == 0.4
-        assert provider.calls[0]["seed"] == 77
-    finally:
-        _reset_for_tests()
+    result = await rewriter.rewrite("hello", history="context", tenant_config=tenant_config)
+    assert result == "rewritten"
+    assert provider.calls
+    assert provider.calls[0]["temperature"] == 0.4
+    assert provider.calls[0]["seed"] == 77
@@ -1,3 +1,4 @@
+from contextlib import ExitStack
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -7,39 +8,54 @@ from src.core.retrieval.application.retrieval_service import RetrievalResult, Re
 from src.shared.kernel.models.query import QueryOptions, SearchMode
 
 
-@pytest.mark.asyncio
-async def test_hybrid_search_uses_tenant_weights():
-    """Verify hybrid path forwards tenant weights into adaptive fusion."""
-    vector_store = MagicMock()
-    graph_store = MagicMock()
-    document_repository = MagicMock()
-    document_repository.get_chunks = AsyncMock(return_value=[])
+@pytest.fixture(scope="module")
+def retrieval_service_factory():
+    """
+    Build RetrievalServices with the provider factory and caches patched.
 
+    The patches are entered once for the module; each call returns a fresh
+    service whose searchers share the same empty-result AsyncMocks.
+    """
     mock_factory = MagicMock()
     mock_factory.get_embedding_provider.return_value = MagicMock()
     mock_factory.get_llm_provider.return_value = MagicMock()
+    embed_single = AsyncMock(return_value=[0.1] * 8)
+    empty_search = AsyncMock(return_value=[])
 
-    with (
-        patch(
-            "src.core.retrieval.application.retrieval_service.build_provider_factory",
-            return_value=mock_factory,
-        ),
-        patch("src.core.retrieval.application.retrieval_service.SemanticCache"),
-        patch("src.core.retrieval.application.retrieval_service.ResultCache"),
-    ):
-        service = RetrievalService(
-            document_repository=document_repository,
-            vector_store=vector_store,
-            neo4j_client=graph_store,
-            openai_api_key="sk-test",
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch(
+                "src.core.retrieval.application.retrieval_service.build_provider_factory",
+                return_value=mock_factory,
+            )
         )
+        stack.enter_context(patch("src.core.retrieval.application.retrieval_service.SemanticCache"))
+        stack.enter_context(patch("src.core.retrieval.application.retrieval_service.ResultCache"))
 
-    service.embedding_service.embed_single = AsyncMock(return_value=[0.1] * 8)
-    service.vector_searcher.search = AsyncMock(return_value=[])
-    service.entity_searcher.search = AsyncMock(return_value=[])
-    service.graph_searcher.search_by_entities = AsyncMock(return_value=[])
-    service.graph_traversal.beam_search = AsyncMock(return_value=[])
-    service.reranker = None
+        def _make() -> RetrievalService:
+            document_repository = MagicMock()
+            document_repository.get_chunks = empty_search
+            service = RetrievalService(
+                document_repository=document_repository,
+                vector_store=MagicMock(),
+                neo4j_client=MagicMock(),
+                openai_api_key="sk-test",
+            )
+            service.embedding_service.embed_single = embed_single
+            service.vector_searcher.search = empty_search
+            service.entity_searcher.search = empty_search
+            service.graph_searcher.search_by_entities = empty_search
+            service.graph_traversal.beam_search = empty_search
+            service.reranker = None
+            return service
+
+        yield _make
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_hybrid_search_uses_tenant_weights(retrieval_service_factory):
+    """Verify hybrid path forwards tenant weights into adaptive fusion."""
+    service = retrieval_service_factory()
 
     structured_query = StructuredQuery(original_query="q", cleaned_query="q")
     options = QueryOptions(search_mode=SearchMode.BASIC)
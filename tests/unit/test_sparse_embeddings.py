@@ -7,6 +7,9 @@ from unittest.mock import patch
 
 import pytest
 
+# Probed once at import; the integration fixture used to repeat this per test
+_HAS_TORCH = find_spec("torch") is not None and find_spec("transformers") is not None
+
 
 # Test without actual model loading
 class TestSparseEmbeddingServiceBatch:
@@ -45,15 +48,13 @@ class TestSparseEmbeddingServiceBatch:
 
 
 @pytest.mark.integration
+@pytest.mark.skipif(not _HAS_TORCH, reason="torch/transformers not available")
 class TestSparseEmbeddingServiceIntegration:
     """Integration-style tests (torch path without network/model downloads)."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def service(self):
         """Create a service with deterministic local tokenizer/model stubs."""
-        if find_spec("torch") is None or find_spec("transformers") is None:
-            pytest.skip("torch/transformers not available")
-
         import torch
 
         from src.core.retrieval.application.sparse_embeddings_service import SparseEmbeddingService
@@ -92,14 +93,14 @@ class TestSparseEmbeddingServiceIntegration:
             ) -> DummyBatch:
                 assert return_tensors == "pt"
                 assert padding and truncation
-                encoded = [self._encode(text, max_length=max_length) for text in texts]
-                max_len = max(len(row) for row in encoded)
-                input_ids = torch.zeros((len(encoded), max_len), dtype=torch.long)
-                attention_mask = torch.zeros((len(encoded), max_len), dtype=torch.long)
-                for idx, row in enumerate(encoded):
-                    row_tensor = torch.tensor(row, dtype=torch.long)
-                    input_ids[idx, : len(row)] = row_tensor
-                    attention_mask[idx, : len(row)] = 1
+                rows = [
+                    torch.tensor(self._encode(text, max_length=max_length), dtype=torch.long)
+                    for text in texts
+                ]
+                # Pad the whole batch in one call; token ids start at 1, so
+                # the padding value 0 doubles as the mask boundary
+                input_ids = torch.nn.utils.rnn.pad_sequence(rows, batch_first=True)
+                attention_mask = (input_ids != 0).long()
                 return DummyBatch(input_ids=input_ids, attention_mask=attention_mask)
 
         class DummyModel(torch.nn.Module):
@@ -120,33 +121,32 @@ class TestSparseEmbeddingServiceIntegration:
         service._device = "cpu"
         return service
 
-    def test_embed_batch_produces_results(self, service):
+    @pytest.fixture(scope="class")
+    def reference(self, service):
+        """Embed a 40-text corpus once (5 batches of 8) for the tests to share."""
+        texts = [f"Text number {i}" for i in range(40)]
+        return texts, service.embed_batch(texts, batch_size=8)
+
+    def test_embed_batch_produces_results(self, reference):
         """Batch should produce results for each input text."""
-        texts = ["Hello world", "This is a test", "GPU acceleration"]
-        results = service.embed_batch(texts)
+        _, results = reference
 
-        assert len(results) == 3
         for result in results:
             assert isinstance(result, dict)
             # Each result should have some non-zero weights
             assert len(result) > 0
 
-    def test_embed_batch_consistency(self, service):
+    def test_embed_batch_consistency(self, service, reference):
         """Results should be consistent between batch and single."""
-        text = "Consistency test"
-
-        single_result = service.embed_sparse(text)
-        batch_result = service.embed_batch([text])[0]
+        texts, results = reference
 
         # Should be identical
-        assert single_result == batch_result
+        assert service.embed_sparse(texts[0]) == results[0]
 
-    def test_embed_batch_larger_than_batch_size(self, service):
+    def test_embed_batch_larger_than_batch_size(self, reference):
         """Should handle inputs larger than batch size."""
-        # Create 40 texts (batch_size is 32)
-        texts = [f"Text number {i}" for i in range(40)]
-        results = service.embed_batch(texts, batch_size=8)
+        texts, results = reference
 
-        assert len(results) == 40
+        assert len(results) == len(texts) == 40
         for result in results:
             assert isinstance(result, dict)
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import pytest
 
 from src.core.cache import decorators as cache_decorators
@@ -8,17 +10,23 @@ from src.core.ingestion.application.use_cases_documents import (
 )
 
 
-class FakeRepo:
-    def __init__(self) -> None:
-        self.saved = []
+async def _none_coro(*_args, **_kwargs):
+    return None
+
+
+async def _empty_list_coro(*_args, **_kwargs):
+    return []
 
-    async def find_by_content_hash(self, *_args, **_kwargs):
-        return None
 
-    async def save(self, document):
-        self.saved.append(document)
+def _make_repo() -> SimpleNamespace:
+    saved: list = []
+
+    async def _save(document):
+        saved.append(document)
         return document
 
+    return SimpleNamespace(find_by_content_hash=_none_coro, save=_save, saved=saved)
+
 
 class FakeUoW:
     def __init__(self) -> None:
@@ -31,17 +39,9 @@ class FakeUoW:
         return None
 
 
-class FakeStorage:
-    def upload_file(self, *_args, **_kwargs):
-        return None
-
-
-class FakeGraphClient:
-    async def execute_write(self, *_args, **_kwargs):
-        return None
-
-    async def execute_read(self, *_args, **_kwargs):
-        return []
+# Stateless collaborators: one instance serves every test
+_STORAGE = SimpleNamespace(upload_file=lambda *_args, **_kwargs: None)
+_GRAPH_CLIENT = SimpleNamespace(execute_write=_none_coro, execute_read=_empty_list_coro)
 
 
 class StubChunker:
@@ -70,35 +70,46 @@ class StubDocument:
             setattr(self, key, value)
 
 
-def _stub_cache_delete(monkeypatch):
-    async def _delete_cache(_key: str):
-        return True
+_STUB_TABLE = (
+    ("SemanticChunker", StubChunker),
+    ("EmbeddingService", StubEmbeddingService),
+    ("GraphProcessor", StubGraphProcessor),
+    ("GraphEnricher", StubGraphEnricher),
+    ("Document", StubDocument),
+)
 
-    monkeypatch.setattr(cache_decorators, "delete_cache", _delete_cache)
 
+async def _direct_to_thread(func, *args, **kwargs):
+    return func(*args, **kwargs)
 
-@pytest.mark.asyncio
-async def test_upload_use_case_accepts_ports_only(monkeypatch):
-    monkeypatch.setattr(service_module, "SemanticChunker", StubChunker)
-    monkeypatch.setattr(service_module, "EmbeddingService", StubEmbeddingService)
-    monkeypatch.setattr(service_module, "GraphProcessor", StubGraphProcessor)
-    monkeypatch.setattr(service_module, "GraphEnricher", StubGraphEnricher)
-    monkeypatch.setattr(service_module, "Document", StubDocument)
-    _stub_cache_delete(monkeypatch)
 
-    async def _direct_to_thread(func, *args, **kwargs):
-        return func(*args, **kwargs)
+def _install_upload_stubs(monkeypatch) -> list[str]:
+    """Stub the ingestion service collaborators; returns the list of deleted cache keys."""
+    deleted_keys: list[str] = []
 
+    async def _delete_cache(key: str):
+        deleted_keys.append(key)
+        return True
+
+    for name, stub in _STUB_TABLE:
+        monkeypatch.setattr(service_module, name, stub)
     monkeypatch.setattr(service_module.asyncio, "to_thread", _direct_to_thread)
+    monkeypatch.setattr(cache_decorators, "delete_cache", _delete_cache)
+    return deleted_keys
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_upload_use_case_accepts_ports_only(monkeypatch):
+    _install_upload_stubs(monkeypatch)
 
     uow = FakeUoW()
     use_case = UploadDocumentUseCase(
-        document_repository=FakeRepo(),
-        tenant_repository=FakeRepo(),
+        document_repository=_make_repo(),
+        tenant_repository=_make_repo(),
         unit_of_work=uow,
-        storage=FakeStorage(),
+        storage=_STORAGE,
         max_size_bytes=1024,
-        graph_client=FakeGraphClient(),
+        graph_client=_GRAPH_CLIENT,
         vector_store=None,
         task_dispatcher=None,
         event_dispatcher=None,
@@ -117,34 +128,18 @@ async def test_upload_use_case_accepts_ports_only(monkeypatch):
     assert uow.commits == 1
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_upload_use_case_invalidates_tenant_stats_cache(monkeypatch):
-    monkeypatch.setattr(service_module, "SemanticChunker", StubChunker)
-    monkeypatch.setattr(service_module, "EmbeddingService", StubEmbeddingService)
-    monkeypatch.setattr(service_module, "GraphProcessor", StubGraphProcessor)
-    monkeypatch.setattr(service_module, "GraphEnricher", StubGraphEnricher)
-    monkeypatch.setattr(service_module, "Document", StubDocument)
-
-    async def _direct_to_thread(func, *args, **kwargs):
-        return func(*args, **kwargs)
-
-    monkeypatch.setattr(service_module.asyncio, "to_thread", _direct_to_thread)
-
-    deleted_keys: list[str] = []
-
-    async def _delete_cache(key: str):
-        deleted_keys.append(key)
-
-    monkeypatch.setattr(cache_decorators, "delete_cache", _delete_cache)
+    deleted_keys = _install_upload_stubs(monkeypatch)
 
     uow = FakeUoW()
     use_case = UploadDocumentUseCase(
-        document_repository=FakeRepo(),
-        tenant_repository=FakeRepo(),
+        document_repository=_make_repo(),
+        tenant_repository=_make_repo(),
         unit_of_work=uow,
-        storage=FakeStorage(),
+        storage=_STORAGE,
         max_size_bytes=1024,
-        graph_client=FakeGraphClient(),
+        graph_client=_GRAPH_CLIENT,
         vector_store=None,
         task_dispatcher=None,
         event_dispatcher=None,